@@ -34,6 +34,7 @@ hidden_imports = [
     'paper_trade_app.core.instrument_mapper',
     'paper_trade_app.core.lot_sizes',
     'paper_trade_app.core.market_simulator',
+    'paper_trade_app.core.pnl_kernel',
     'paper_trade_app.core.report_generator',
     'paper_trade_app.core.session_manager',
     'paper_trade_app.core.simulator_worker',
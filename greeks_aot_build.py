@@ -0,0 +1,46 @@
+"""
+Ahead-of-time build of the paper trade tracker's Black-Scholes kernel
+=====================================================================
+Compiles paper_trade_tracker._bs_core into a regular C extension
+(greeks_aot) with numba.pycc. When the extension is importable,
+paper_trade_tracker uses it and skips importing numba, so interactive
+runs don't pay numba's import and cache-load time.
+
+Usage (re-run after changing _bs_core, or after upgrading Python/NumPy):
+    python greeks_aot_build.py
+
+The extension is platform-specific and is not committed (*.so is ignored).
+
+Author: Options Screener Project
+"""
+
+import glob
+import os
+
+from numba.pycc import CC
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Same signature as the @njit declaration on _bs_core
+BS_CORE_SIGNATURE = "UniTuple(f8, 8)(f8, f8, f8, f8, f8, b1)"
+
+
+def build():
+    """Compile greeks_aot next to paper_trade_tracker.py."""
+    # Remove a previous build first: while it is importable the tracker
+    # skips numba, and _bs_core would not be a numba function to compile
+    for old in glob.glob(os.path.join(HERE, "greeks_aot.*")):
+        if old.endswith((".so", ".pyd")):
+            os.remove(old)
+
+    import paper_trade_tracker
+
+    cc = CC("greeks_aot")
+    cc.output_dir = HERE
+    cc.export("bs_core", BS_CORE_SIGNATURE)(paper_trade_tracker._bs_core.py_func)
+    cc.compile()
+    print(f"Built greeks_aot in {HERE}")
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,35 @@
+"""
+P&L Kernel for the Positions View
+
+Computes mark-to-market P&L for every open position in a single pass over
+column arrays: (ltp - entry) * qty * side, where side is +1 for BUY and
+-1 for SELL. Numba is used when installed; otherwise the same kernel runs
+as NumPy ufuncs writing into the preallocated output array.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signature compiles at import time (loaded from the on-disk
+    # cache after the first run), so the first tick pays no JIT warmup.
+    @njit(
+        "void(float64[:], float64[:], int32[:], int8[:], float64[:])",
+        cache=True, fastmath=True
+    )
+    def compute_pnl(ltps, entries, qtys, sides, out):
+        """Write per-position gross P&L into `out`."""
+        for i in range(ltps.shape[0]):
+            out[i] = (ltps[i] - entries[i]) * qtys[i] * sides[i]
+else:
+    def compute_pnl(ltps, entries, qtys, sides, out):
+        """Write per-position gross P&L into `out`."""
+        np.subtract(ltps, entries, out=out)
+        np.multiply(out, qtys, out=out)
+        np.multiply(out, sides, out=out)
@@ -12,15 +12,42 @@ Enhanced for Tier 1/2 features:
 import datetime
 import sys
 import io
+import time
+import numpy as np
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QTableWidget, QTableWidgetItem, QHeaderView, 
-    QListWidget, QListWidgetItem, QTextEdit, QPushButton, 
+    QLabel, QTableView, QHeaderView, 
+    QListView, QListWidget, QListWidgetItem, QTextEdit, QPlainTextEdit, QPushButton, 
     QFrame, QMessageBox, QSplitter, QComboBox, QInputDialog,
     QGroupBox, QSizePolicy, QScrollArea, QDialog
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QSize, QAbstractTableModel, QModelIndex, QSignalBlocker
+)
+from PyQt6.QtGui import QColor, QFont, QTextCursor
+
+from core.pnl_kernel import compute_pnl
+
+
+# P&L label colors are selected by the "pnl" dynamic property; the matching
+# QLabel[pnl=...] rules live in MainWindow's stylesheet and are parsed once.
+_PNL_POS = "pos"
+_PNL_NEG = "neg"
+
+# Buttons for the profile confirmation dialogs
+_YES = QMessageBox.StandardButton.Yes
+_YES_NO = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+
+# Returned by MainWindow._validate_profile_name when the name is already saved
+_PROFILE_EXISTS = "EXISTS"
+
+
+def _set_pnl_sign(label: QLabel, positive: bool):
+    """Switch a P&L label between green/red by re-polishing, not re-parsing CSS."""
+    label.setProperty("pnl", _PNL_POS if positive else _PNL_NEG)
+    style = label.style()
+    style.unpolish(label)
+    style.polish(label)
 
 
 class AnalysisReportDialog(QDialog):
@@ -802,6 +829,228 @@ class AlertItemWidget(QWidget):
         self.alert_data['current_ltp'] = ltp
 
 
+class PositionsModel(QAbstractTableModel):
+    """
+    Table model backing the Active Positions view.
+    
+    Column values are kept as parallel arrays (one per column) instead of
+    a QTableWidgetItem per cell. A tick only writes the LTP/P&L slots of
+    one row and marks it dirty; flush() recomputes gross P&L for all rows
+    in one kernel call and emits a single dataChanged for the dirty rows.
+    """
+    
+    HEADERS = [
+        "Symbol", "Side", "Lots", "Qty", "Avg Price",
+        "LTP", "SL", "Target", "Net P&L", "Action"
+    ]
+    COL_LTP = 5
+    COL_PNL = 8
+    COL_ACTION = 9
+    
+    _COLOR_DEFAULT = QColor("#E0E0E0")
+    _COLOR_BUY = QColor("#00E676")
+    _COLOR_SELL = QColor("#FF5252")
+    _COLOR_SL = QColor("#FF9800")
+    _COLOR_TARGET = QColor("#2196F3")
+    _COLOR_NONE = QColor("#666")
+    
+    _NUMERIC_COLUMNS = (
+        '_lots', '_qty', '_side_sign', '_entry', '_ltp', '_sl', '_target', '_pnl', '_pnl_out'
+    )
+    # Price columns rendered as "₹x.xx", or a placeholder while unset
+    _PRICE_COLUMNS = {5: '_ltp', 6: '_sl', 7: '_target', 8: '_pnl'}
+    
+    def __init__(self, parent=None, capacity: int = 32):
+        super().__init__(parent)
+        self._size = 0
+        
+        # Order ID -> row index
+        self._row_map = {}
+        
+        # Text columns
+        self._order_ids = []
+        self._symbols = []
+        self._sides = []
+        
+        # Numeric columns (NaN = not set yet)
+        self._lots = np.zeros(capacity, dtype=np.int32)
+        self._qty = np.zeros(capacity, dtype=np.int32)
+        self._entry = np.zeros(capacity, dtype=np.float64)
+        self._ltp = np.full(capacity, np.nan, dtype=np.float64)
+        self._sl = np.full(capacity, np.nan, dtype=np.float64)
+        self._target = np.full(capacity, np.nan, dtype=np.float64)
+        self._pnl = np.full(capacity, np.nan, dtype=np.float64)
+        
+        # Kernel inputs/output: +1 BUY / -1 SELL, and gross P&L per row
+        self._side_sign = np.zeros(capacity, dtype=np.int8)
+        self._pnl_out = np.full(capacity, np.nan, dtype=np.float64)
+        
+        # Rows touched since the last flush (inclusive range)
+        self._dirty_lo = None
+        self._dirty_hi = None
+    
+    def _ensure_capacity(self, needed: int):
+        """Grow the numeric columns geometrically so appends stay amortized O(1)."""
+        capacity = self._entry.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in self._NUMERIC_COLUMNS:
+            old = getattr(self, name)
+            fill = 0 if old.dtype.kind == 'i' else np.nan
+            grown = np.full(new_capacity, fill, dtype=old.dtype)
+            grown[:capacity] = old
+            setattr(self, name, grown)
+    
+    # --- Qt model interface ---
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._size
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(row, col)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            text = self._display_text(row, col)
+            gross = self._pnl_out[row]
+            if col == self.COL_PNL and not np.isnan(gross):
+                text = f"{text} (Gross: ₹{gross:.2f})"
+            return text
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foreground(row, col)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+    
+    def _display_text(self, row: int, col: int):
+        if col == 0:
+            return self._symbols[row]
+        if col == 1:
+            return self._sides[row]
+        if col == 2:
+            return str(self._lots[row])
+        if col == 3:
+            return str(self._qty[row])
+        if col == 4:
+            return f"₹{self._entry[row]:.2f}"
+        if col == self.COL_ACTION:
+            return None
+        
+        value = getattr(self, self._PRICE_COLUMNS[col])[row]
+        if np.isnan(value):
+            return "₹0.00" if col == self.COL_PNL else "---"
+        return f"₹{value:.2f}"
+    
+    def _foreground(self, row: int, col: int):
+        if col == 1:
+            return self._COLOR_BUY if self._sides[row] == "BUY" else self._COLOR_SELL
+        if col == 6:
+            return self._COLOR_NONE if np.isnan(self._sl[row]) else self._COLOR_SL
+        if col == 7:
+            return self._COLOR_NONE if np.isnan(self._target[row]) else self._COLOR_TARGET
+        if col == self.COL_PNL:
+            pnl = self._pnl[row]
+            if np.isnan(pnl):
+                return self._COLOR_DEFAULT
+            return self._COLOR_BUY if pnl >= 0 else self._COLOR_SELL
+        return self._COLOR_DEFAULT
+    
+    # --- Position mutations ---
+    
+    def append_row(self, order: dict) -> int:
+        """Append a position and return its row index."""
+        row = self._size
+        self._ensure_capacity(row + 1)
+        
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._order_ids.append(order['id'])
+        self._symbols.append(str(order['symbol']))
+        self._sides.append(order['action'])
+        self._side_sign[row] = 1 if order['action'] == "BUY" else -1
+        self._lots[row] = order.get('lots', order['quantity'] // order.get('lot_size', 1))
+        self._qty[row] = order['quantity']
+        self._entry[row] = order['entry_price']
+        self._ltp[row] = np.nan
+        self._sl[row] = order.get('stop_loss') or np.nan
+        self._target[row] = order.get('target') or np.nan
+        self._pnl[row] = np.nan
+        self._pnl_out[row] = np.nan
+        self._row_map[order['id']] = row
+        self._size += 1
+        self.endInsertRows()
+        return row
+    
+    def update_ltp_pnl(self, order_id: str, ltp: float, pnl: float):
+        """Record LTP and Net P&L for a position; repainted on the next flush()."""
+        row = self._row_map.get(order_id)
+        if row is None:
+            return
+        self._ltp[row] = ltp
+        self._pnl[row] = pnl
+        if self._dirty_lo is None:
+            self._dirty_lo = self._dirty_hi = row
+        else:
+            self._dirty_lo = min(self._dirty_lo, row)
+            self._dirty_hi = max(self._dirty_hi, row)
+    
+    def flush(self):
+        """Recompute gross P&L for all rows and repaint the rows updated since last flush."""
+        if self._dirty_lo is None:
+            return
+        lo, hi = self._dirty_lo, min(self._dirty_hi, self._size - 1)
+        self._dirty_lo = self._dirty_hi = None
+        if lo > hi:
+            return
+        
+        n = self._size
+        compute_pnl(
+            self._ltp[:n], self._entry[:n], self._qty[:n],
+            self._side_sign[:n], self._pnl_out[:n]
+        )
+        self.dataChanged.emit(
+            self.index(lo, self.COL_LTP),
+            self.index(hi, self.COL_PNL),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole]
+        )
+    
+    def remove_row(self, order_id: str) -> bool:
+        """Remove a position row. Returns False if the order is not shown."""
+        row = self._row_map.pop(order_id, None)
+        if row is None:
+            return False
+        
+        last = self._size - 1
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._order_ids[row]
+        del self._symbols[row]
+        del self._sides[row]
+        for name in self._NUMERIC_COLUMNS:
+            column = getattr(self, name)
+            column[row:last] = column[row + 1:last + 1]
+        self._size = last
+        
+        # Only rows below the removed one shift up
+        for i in range(row, last):
+            self._row_map[self._order_ids[i]] = i
+        self.endRemoveRows()
+        return True
+
+
 class MainWindow(QMainWindow):
     # Signal emitted when "Exit" button is clicked - now sends order_id (str)
     square_off_signal = pyqtSignal(str)
@@ -818,6 +1067,12 @@ class MainWindow(QMainWindow):
     # Analysis report signals
     basic_analyze_signal = pyqtSignal(dict)    # Emitted when user clicks "Basic" analyze (alert_data)
     enhanced_analyze_signal = pyqtSignal(dict) # Emitted when user clicks "Full" analyze (alert_data)
+    
+    _NOTIFICATION_ICONS = {
+        "info": QMessageBox.Icon.Information,
+        "warning": QMessageBox.Icon.Warning,
+        "error": QMessageBox.Icon.Critical,
+    }
 
     def __init__(self):
         super().__init__()
@@ -830,7 +1085,10 @@ class MainWindow(QMainWindow):
             QWidget { background-color: #121212; color: #E0E0E0; }
             QFrame { border: 1px solid #333; border-radius: 6px; }
             QLabel { color: #E0E0E0; border: none; }
-            QTableWidget { 
+            QLabel[pnl="flat"] { color: #888; }
+            QLabel[pnl="pos"] { color: #00E676; }
+            QLabel[pnl="neg"] { color: #FF5252; }
+            QTableView { 
                 background-color: #1E1E1E; 
                 gridline-color: #333; 
                 border: none;
@@ -843,7 +1101,7 @@ class MainWindow(QMainWindow):
                 color: #AAA;
                 font-weight: bold;
             }
-            QTextEdit { 
+            QTextEdit, QPlainTextEdit { 
                 background-color: #000; 
                 color: #00E676; 
                 font-family: Consolas, monospace; 
@@ -881,8 +1139,14 @@ class MainWindow(QMainWindow):
         # 4. FOOTER (Buttons)
         self._setup_footer()
 
-        # Row Tracker: Maps Order ID -> Row Index (for fast updates)
-        self.row_map = {}
+        # Notification dialogs, created on first use per severity and reused
+        self._notification_boxes = {}
+
+        # Resize debounce: heavy panels stay frozen until the drag settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(80)
+        self._resize_timer.timeout.connect(self._resume_updates)
 
     def _setup_header(self):
         header_frame = QFrame()
@@ -939,13 +1203,16 @@ class MainWindow(QMainWindow):
         self.lbl_total_pnl = QLabel("NET P&L: ₹ 0.00")
         self.lbl_total_pnl.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
         self.lbl_total_pnl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lbl_total_pnl.setStyleSheet("font-size: 20px;")
         
         # Breakdown row
         breakdown_layout = QHBoxLayout()
         self.lbl_realized = QLabel("Realized: ₹0.00")
-        self.lbl_realized.setStyleSheet("color: #888; font-size: 11px;")
+        self.lbl_realized.setProperty("pnl", "flat")
+        self.lbl_realized.setStyleSheet("font-size: 11px;")
         self.lbl_unrealized = QLabel("Unrealized: ₹0.00")
-        self.lbl_unrealized.setStyleSheet("color: #888; font-size: 11px;")
+        self.lbl_unrealized.setProperty("pnl", "flat")
+        self.lbl_unrealized.setStyleSheet("font-size: 11px;")
         self.lbl_fees = QLabel("Fees: ₹0.00")
         self.lbl_fees.setStyleSheet("color: #FF9800; font-size: 11px;")
         
@@ -955,6 +1222,17 @@ class MainWindow(QMainWindow):
         breakdown_layout.addWidget(QLabel("|"))
         breakdown_layout.addWidget(self.lbl_fees)
         
+        # Last shown (total, realized, unrealized, fees) and sign per label,
+        # so repeated ticks skip setText/restyling on unchanged labels
+        self._last_pnl = (None, None, None, None)
+        self._last_sign = [None, None, None]
+        
+        # Latest P&L summary not yet painted; applied at most every 50 ms
+        self._pending_pnl = None
+        self._pnl_timer = QTimer(self)
+        self._pnl_timer.setInterval(50)
+        self._pnl_timer.timeout.connect(self._apply_pnl)
+        
         pnl_layout.addWidget(self.lbl_total_pnl)
         pnl_layout.addLayout(breakdown_layout)
         
@@ -1035,12 +1313,10 @@ class MainWindow(QMainWindow):
         header.setStyleSheet("font-weight: bold; font-size: 13px;")
         layout.addWidget(header)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels([
-            "Symbol", "Side", "Lots", "Qty", "Avg Price", 
-            "LTP", "SL", "Target", "Net P&L", "Action"
-        ])
+        # Model owns the position data; the view only paints changed cells
+        self._model = PositionsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self._model)
         
         # Enable interactive column resizing
         header = self.table.horizontalHeader()
@@ -1061,7 +1337,7 @@ class MainWindow(QMainWindow):
         self.table.setColumnWidth(9, 70)    # Action
         
         # Enable horizontal scrollbar when needed
-        self.table.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         
         # Show tooltips for truncated text
@@ -1070,8 +1346,8 @@ class MainWindow(QMainWindow):
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
         self.table.setStyleSheet("""
-            QTableWidget::item:alternate { background-color: #252525; }
-            QTableWidget::item { padding: 4px; }
+            QTableView::item:alternate { background-color: #252525; }
+            QTableView::item { padding: 4px; }
             QHeaderView::section {
                 background-color: #2a2a2a;
                 color: #e0e0e0;
@@ -1086,6 +1362,11 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(self.table)
         
+        # Repaint ticked rows in batches instead of once per tick
+        self._pnl_flush_timer = QTimer(self)
+        self._pnl_flush_timer.timeout.connect(self._model.flush)
+        self._pnl_flush_timer.start(100)
+        
         # Add to Content Layout (70% width)
         self.content_layout.addLayout(layout, 70)
 
@@ -1094,10 +1375,23 @@ class MainWindow(QMainWindow):
         log_header.setStyleSheet("font-weight: bold; font-size: 13px;")
         self.main_layout.addWidget(log_header)
         
-        self.log_box = QTextEdit()
+        self.log_box = QPlainTextEdit()
         self.log_box.setMaximumHeight(140)
         self.log_box.setReadOnly(True)
+        self.log_box.setMaximumBlockCount(5000)
         self.main_layout.addWidget(self.log_box)
+        
+        # Writes go straight into the document as plain text
+        self._log_cursor = QTextCursor(self.log_box.document())
+        
+        # (epoch second, message) queued by append_log, written in one batch per flush
+        self._log_pending = []
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start(150)
+        
+        # (epoch second, "HH:MM:SS") - log bursts within a second reuse the string
+        self._ts_cache = (0, "")
 
     def _setup_footer(self):
         footer_layout = QHBoxLayout()
@@ -1133,6 +1427,13 @@ class MainWindow(QMainWindow):
         # Profile dropdown
         self.profile_combo = QComboBox()
         self.profile_combo.setMinimumWidth(150)
+        
+        # Lay out dropdown rows lazily in batches so large profile lists stay responsive
+        profile_view = QListView()
+        profile_view.setUniformItemSizes(True)
+        profile_view.setLayoutMode(QListView.LayoutMode.Batched)
+        profile_view.setBatchSize(100)
+        self.profile_combo.setView(profile_view)
         self.profile_combo.setStyleSheet("""
             QComboBox {
                 background-color: #2C2C2C;
@@ -1158,7 +1459,10 @@ class MainWindow(QMainWindow):
             }
         """)
         self.profile_combo.addItem("-- Select Profile --")
-        self.profile_combo.currentTextChanged.connect(self._on_profile_selected)
+        self.profile_combo.currentIndexChanged.connect(self._on_profile_selected)
+        
+        # Profile name -> combo index (avoids scanning itemText() per lookup)
+        self._profile_index = {}
         
         # Save profile button
         self.btn_save_profile = QPushButton("💾 Save")
@@ -1194,8 +1498,23 @@ class MainWindow(QMainWindow):
 
     # --- UI Logic ---
 
+    def resizeEvent(self, event):
+        """Suspend repaints of the table and alert feed while a resize is in flight."""
+        if not self._resize_timer.isActive():
+            self.table.setUpdatesEnabled(False)
+            self.alert_container.setUpdatesEnabled(False)
+        self._resize_timer.start()
+        super().resizeEvent(event)
+
+    def _resume_updates(self):
+        """Re-enable painting once resizing stops and repaint the final layout."""
+        self.table.setUpdatesEnabled(True)
+        self.alert_container.setUpdatesEnabled(True)
+        self.table.update()
+        self.alert_container.update()
+
     def _update_clock(self):
-        now = datetime.datetime.now().strftime("%H:%M:%S IST")
+        now = time.strftime("%H:%M:%S IST", time.localtime())
         self.lbl_time.setText(now)
 
     def update_status(self, connected, msg):
@@ -1420,50 +1739,7 @@ class MainWindow(QMainWindow):
         Uses order_id as the unique key (supports multiple orders per token).
         """
         order_id = order['id']
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.row_map[order_id] = row
-
-        def item(text, color="#E0E0E0"):
-            i = QTableWidgetItem(str(text))
-            i.setForeground(QColor(color))
-            i.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            i.setFlags(i.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            i.setToolTip(str(text))  # Show full text on hover
-            return i
-
-        # Symbol
-        self.table.setItem(row, 0, item(order['symbol']))
-        
-        # Side (colored)
-        side_color = "#00E676" if order['action'] == "BUY" else "#FF5252"
-        self.table.setItem(row, 1, item(order['action'], side_color))
-        
-        # Lots
-        lots = order.get('lots', order['quantity'] // order.get('lot_size', 1))
-        self.table.setItem(row, 2, item(lots))
-        
-        # Quantity
-        self.table.setItem(row, 3, item(order['quantity']))
-        
-        # Avg Price
-        self.table.setItem(row, 4, item(f"₹{order['entry_price']:.2f}"))
-        
-        # LTP (placeholder)
-        self.table.setItem(row, 5, item("---"))
-        
-        # SL
-        sl = order.get('stop_loss')
-        sl_text = f"₹{sl:.2f}" if sl else "---"
-        self.table.setItem(row, 6, item(sl_text, "#FF9800" if sl else "#666"))
-        
-        # Target
-        target = order.get('target')
-        target_text = f"₹{target:.2f}" if target else "---"
-        self.table.setItem(row, 7, item(target_text, "#2196F3" if target else "#666"))
-        
-        # Net P&L (placeholder)
-        self.table.setItem(row, 8, item("₹0.00"))
+        row = self._model.append_row(order)
 
         # Exit Button
         btn = QPushButton("EXIT")
@@ -1476,7 +1752,7 @@ class MainWindow(QMainWindow):
             print(f"[DEBUG] Exit button clicked for order: {oid}")
             self.square_off_signal.emit(oid)
         btn.clicked.connect(emit_exit)
-        self.table.setCellWidget(row, 9, btn)
+        self.table.setIndexWidget(self._model.index(row, PositionsModel.COL_ACTION), btn)
 
     def update_pnl_cell(self, data):
         """
@@ -1484,95 +1760,127 @@ class MainWindow(QMainWindow):
         data = {'order_id': 'ORD_1', 'token': 123, 'ltp': 150.0, 'net_pnl': 500.0, ...}
         """
         order_id = data.get('order_id')
-        
-        if order_id and order_id in self.row_map:
-            row = self.row_map[order_id]
-            
-            # Update LTP
-            ltp = data.get('ltp', 0)
-            ltp_item = self.table.item(row, 5)
-            if ltp_item:
-                ltp_item.setText(f"₹{ltp:.2f}")
-            
-            # Update Net P&L
-            net_pnl = data.get('net_pnl', 0)
-            pnl_item = self.table.item(row, 8)
-            if pnl_item:
-                pnl_item.setText(f"₹{net_pnl:.2f}")
-                if net_pnl >= 0:
-                    pnl_item.setForeground(QColor("#00E676"))
-                else:
-                    pnl_item.setForeground(QColor("#FF5252"))
+        if order_id:
+            self._model.update_ltp_pnl(order_id, data.get('ltp', 0), data.get('net_pnl', 0))
 
     def remove_position_row(self, order_id: str):
         """Remove a position row when it's closed."""
-        if order_id in self.row_map:
-            row = self.row_map[order_id]
-            self.table.removeRow(row)
-            del self.row_map[order_id]
-            
-            # Update row indices for remaining entries
-            updated_map = {}
-            for oid, r in self.row_map.items():
-                if r > row:
-                    updated_map[oid] = r - 1
-                else:
-                    updated_map[oid] = r
-            self.row_map = updated_map
+        # Qt drops the row's EXIT button together with the row
+        self._model.remove_row(order_id)
 
     def update_total_pnl(self, pnl_data):
         """
-        Update the header P&L display.
+        Queue a header P&L update; only the latest one is painted (max 20/sec).
         pnl_data = {'realized': 100.0, 'unrealized': 50.0, 'total': 150.0, 'fees_paid': 20.0}
+        or a bare total (float) from the legacy update_net_pnl path.
         """
-        realized = pnl_data.get('realized', 0)
-        unrealized = pnl_data.get('unrealized', 0)
-        total = pnl_data.get('total', realized + unrealized)
-        fees = pnl_data.get('fees_paid', 0)
-        
-        # Update main P&L
-        self.lbl_total_pnl.setText(f"NET P&L: ₹{total:,.2f}")
-        if total >= 0:
-            self.lbl_total_pnl.setStyleSheet("color: #00E676; font-size: 20px;")
+        self._pending_pnl = pnl_data
+        if not self._pnl_timer.isActive():
+            self._pnl_timer.start()
+
+    def _apply_pnl(self):
+        """Paint the most recent queued P&L summary; stop the timer once idle."""
+        pnl_data = self._pending_pnl
+        if pnl_data is None:
+            self._pnl_timer.stop()
+            return
+        self._pending_pnl = None
+        
+        if isinstance(pnl_data, dict):
+            realized = pnl_data.get('realized', 0)
+            unrealized = pnl_data.get('unrealized', 0)
+            total = pnl_data.get('total', realized + unrealized)
+            fees = pnl_data.get('fees_paid', 0)
         else:
-            self.lbl_total_pnl.setStyleSheet("color: #FF5252; font-size: 20px;")
+            total, realized, unrealized, fees = pnl_data, 0, 0, 0
+        
+        values = (total, realized, unrealized, fees)
+        if values == self._last_pnl:
+            return
+        last_total, last_realized, last_unrealized, last_fees = self._last_pnl
+        self._last_pnl = values
+        
+        # Update main P&L (+ 0.0 turns a rounded -0.0 into 0.0, so it never shows as ₹-0.00)
+        if total != last_total:
+            self.lbl_total_pnl.setText(f"NET P&L: ₹{total + 0.0:,.2f}")
+            positive = total >= 0
+            if positive != self._last_sign[0]:
+                self._last_sign[0] = positive
+                _set_pnl_sign(self.lbl_total_pnl, positive)
         
         # Update breakdown
-        self.lbl_realized.setText(f"Realized: ₹{realized:,.2f}")
-        if realized >= 0:
-            self.lbl_realized.setStyleSheet("color: #00E676; font-size: 11px;")
-        else:
-            self.lbl_realized.setStyleSheet("color: #FF5252; font-size: 11px;")
-            
-        self.lbl_unrealized.setText(f"Unrealized: ₹{unrealized:,.2f}")
-        if unrealized >= 0:
-            self.lbl_unrealized.setStyleSheet("color: #00E676; font-size: 11px;")
-        else:
-            self.lbl_unrealized.setStyleSheet("color: #FF5252; font-size: 11px;")
-            
-        self.lbl_fees.setText(f"Fees: ₹{fees:,.2f}")
+        if realized != last_realized:
+            self.lbl_realized.setText(f"Realized: ₹{realized + 0.0:,.2f}")
+            positive = realized >= 0
+            if positive != self._last_sign[1]:
+                self._last_sign[1] = positive
+                _set_pnl_sign(self.lbl_realized, positive)
+        
+        if unrealized != last_unrealized:
+            self.lbl_unrealized.setText(f"Unrealized: ₹{unrealized + 0.0:,.2f}")
+            positive = unrealized >= 0
+            if positive != self._last_sign[2]:
+                self._last_sign[2] = positive
+                _set_pnl_sign(self.lbl_unrealized, positive)
+        
+        if fees != last_fees:
+            self.lbl_fees.setText(f"Fees: ₹{fees:,.2f}")
 
     def update_net_pnl(self, total_pnl):
         """Legacy method for backward compatibility."""
-        self.update_total_pnl({'total': total_pnl})
+        self.update_total_pnl(total_pnl)
 
     def show_notification(self, title: str, message: str, msg_type: str = "info"):
-        """Show a notification popup."""
-        if msg_type == "info":
-            QMessageBox.information(self, title, message)
-        elif msg_type == "warning":
-            QMessageBox.warning(self, title, message)
-        elif msg_type == "error":
-            QMessageBox.critical(self, title, message)
+        """Show a notification popup (one reusable dialog per severity)."""
+        icon = self._NOTIFICATION_ICONS.get(msg_type)
+        if icon is None:
+            return
+        box = self._notification_boxes.get(msg_type)
+        if box is None:
+            box = QMessageBox(icon, "", "", QMessageBox.StandardButton.Ok, self)
+            box.setModal(True)
+            self._notification_boxes[msg_type] = box
+        box.setWindowTitle(title)
+        box.setText(message)
+        box.exec()
 
     def append_log(self, msg):
-        """Append a message to the log panel."""
-        ts = datetime.datetime.now().strftime("%H:%M:%S")
-        self.log_box.append(f"[{ts}] {msg}")
-        # Auto-scroll to bottom
-        self.log_box.verticalScrollBar().setValue(
-            self.log_box.verticalScrollBar().maximum()
-        )
+        """Queue a message for the log panel; timestamp formatting happens at flush."""
+        self._log_pending.append((int(time.time()), msg))
+    
+    def _log_timestamp(self, sec: int) -> str:
+        """Return "HH:MM:SS" for an epoch second, reusing the last result."""
+        if sec == self._ts_cache[0]:
+            return self._ts_cache[1]
+        t = time.localtime(sec)
+        ts = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+        self._ts_cache = (sec, ts)
+        return ts
+    
+    def _flush_log(self):
+        """Write all queued log lines with a single append and scroll once."""
+        if not self._log_pending:
+            return
+        timestamp = self._log_timestamp
+        lines = [f"[{timestamp(sec)}] {msg}" for sec, msg in self._log_pending]
+        self._log_pending.clear()
+        
+        # Only follow new lines if the user hasn't scrolled up to read history
+        scrollbar = self.log_box.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        
+        text = "\n".join(lines)
+        cursor = self._log_cursor
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.log_box.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text)
+        
+        if at_bottom:
+            cursor = self.log_box.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            self.log_box.setTextCursor(cursor)
+            self.log_box.ensureCursorVisible()
     
     # --- Config Profile Methods ---
     
@@ -1583,39 +1891,47 @@ class MainWindow(QMainWindow):
         Args:
             profiles: List of profile names
         """
-        self.profile_combo.blockSignals(True)
-        self.profile_combo.clear()
-        self.profile_combo.addItem("-- Select Profile --")
-        for profile in profiles:
-            self.profile_combo.addItem(profile)
-        self.profile_combo.blockSignals(False)
+        view = self.profile_combo.view()
+        with QSignalBlocker(self.profile_combo):
+            view.setUpdatesEnabled(False)
+            try:
+                self.profile_combo.clear()
+                self.profile_combo.addItems(["-- Select Profile --", *profiles])
+                self._profile_index = {name: i for i, name in enumerate(profiles, start=1)}
+            finally:
+                view.setUpdatesEnabled(True)
     
     def add_profile(self, name: str):
         """Add a new profile to the dropdown."""
-        # Check if already exists
-        for i in range(self.profile_combo.count()):
-            if self.profile_combo.itemText(i) == name:
-                return
+        if name in self._profile_index:
+            return
+        self._profile_index[name] = self.profile_combo.count()
         self.profile_combo.addItem(name)
     
     def remove_profile(self, name: str):
         """Remove a profile from the dropdown."""
-        for i in range(self.profile_combo.count()):
-            if self.profile_combo.itemText(i) == name:
-                self.profile_combo.removeItem(i)
-                break
+        idx = self._profile_index.pop(name, None)
+        if idx is None:
+            return
+        # Removing the current item must not load its neighbour as a side effect
+        with QSignalBlocker(self.profile_combo):
+            self.profile_combo.removeItem(idx)
+        # Entries after the removed one shift up by one
+        for profile, i in self._profile_index.items():
+            if i > idx:
+                self._profile_index[profile] = i - 1
     
     def get_selected_profile(self) -> str:
         """Get the currently selected profile name."""
-        text = self.profile_combo.currentText()
-        if text == "-- Select Profile --":
+        # Index 0 is always the "-- Select Profile --" placeholder
+        if self.profile_combo.currentIndex() <= 0:
             return ""
-        return text
+        return self.profile_combo.currentText()
     
-    def _on_profile_selected(self, text: str):
+    def _on_profile_selected(self, index: int):
         """Handle profile selection change."""
-        if text and text != "-- Select Profile --":
-            self.profile_load_signal.emit(text)
+        if index > 0:
+            self.profile_load_signal.emit(self.profile_combo.itemText(index))
     
     def _on_save_profile_clicked(self):
         """Handle save profile button click."""
@@ -1626,29 +1942,42 @@ class MainWindow(QMainWindow):
             text="my_config"
         )
         
-        if ok and name:
-            # Validate name
-            name = name.strip()
-            if not name:
-                QMessageBox.warning(self, "Invalid Name", "Profile name cannot be empty.")
+        if not (ok and name):
+            return
+        
+        name, error = self._validate_profile_name(name)
+        if error == _PROFILE_EXISTS:
+            reply = QMessageBox.question(
+                self,
+                "Overwrite Profile?",
+                f"Profile '{name}' already exists. Overwrite?",
+                _YES_NO
+            )
+            if reply != _YES:
                 return
-            
-            # Check for overwrite
-            for i in range(self.profile_combo.count()):
-                if self.profile_combo.itemText(i) == name:
-                    reply = QMessageBox.question(
-                        self,
-                        "Overwrite Profile?",
-                        f"Profile '{name}' already exists. Overwrite?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                    )
-                    if reply != QMessageBox.StandardButton.Yes:
-                        return
-                    break
-            
-            self.profile_save_signal.emit(name)
-            self.add_profile(name)
-            self.append_log(f"💾 Config profile saved: {name}")
+        elif error:
+            QMessageBox.warning(self, "Invalid Name", error)
+            return
+        
+        self.profile_save_signal.emit(name)
+        self.add_profile(name)
+        self.append_log(f"💾 Config profile saved: {name}")
+    
+    def _validate_profile_name(self, raw: str) -> tuple:
+        """
+        Normalize and check a profile name in one pass.
+        
+        Returns:
+            (name, error) - error is None if the name is new and valid,
+            _PROFILE_EXISTS if it would overwrite a profile, otherwise
+            the message to show (name is None in that case).
+        """
+        name = raw.strip()
+        if not name:
+            return None, "Profile name cannot be empty."
+        if name in self._profile_index:
+            return name, _PROFILE_EXISTS
+        return name, None
     
     def _on_delete_profile_clicked(self):
         """Handle delete profile button click."""
@@ -1666,10 +1995,10 @@ class MainWindow(QMainWindow):
             self,
             "Delete Profile?",
             f"Are you sure you want to delete profile '{name}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            _YES_NO
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
+        if reply == _YES:
             self.profile_delete_signal.emit(name)
             self.remove_profile(name)
             self.profile_combo.setCurrentIndex(0)
@@ -14,20 +14,53 @@ Author: Options Screener Project
 """
 
 import os
+import sys
 import json
 import math
-import pandas as pd
+import time
+import functools
 import numpy as np
 from datetime import datetime, timedelta
-from scipy.stats import norm
-import yfinance as yf
+from typing import NamedTuple
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    # Ahead-of-time compiled _bs_core (build with greeks_aot_build.py);
+    # when present numba is not needed, which keeps startup fast
+    from greeks_aot import bs_core as _bs_core_aot
+    GREEKS_AOT_AVAILABLE = True
+except ImportError:
+    GREEKS_AOT_AVAILABLE = False
+
+NUMBA_AVAILABLE = False
+if not GREEKS_AOT_AVAILABLE:
+    try:
+        from numba import njit
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        pass
+
+if not NUMBA_AVAILABLE:
+    def njit(*args, **kwargs):
+        """Fallback: run the kernels as plain Python when numba is missing."""
+        def decorator(func):
+            return func
+        return decorator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ================== CONFIGURATION ==================
 TRADES_FILE = "paper_trades.json"
 HISTORY_FILE = "trade_history.csv"
+HISTORY_NDJSON = "trade_history.ndjson"  # Append-only per-update history log
 RISK_FREE_RATE = 0.065  # 6.5% (approximate Indian risk-free rate)
+SPOT_CACHE_TTL = 30  # Seconds a fetched spot price is reused
+IV_NEWTON_ITERS = 10  # Halley/Newton steps before unconverged IVs go to Brent's method
 
 # Symbol to Yahoo Finance ticker mapping
 SYMBOL_MAP = {
@@ -44,95 +77,304 @@ LOT_SIZES = {
     "ONGC": 3850, "BPCL": 1800, "MUTHOOTFIN": 375,
 }
 
+@functools.lru_cache(maxsize=256)
+def _lot_size(symbol):
+    """Lot size for symbol (default 500)"""
+    return LOT_SIZES.get(symbol, 500)
+
+@functools.lru_cache(maxsize=256)
+def _yf_ticker(symbol):
+    """Yahoo Finance ticker for symbol (NSE equities get the .NS suffix)"""
+    return SYMBOL_MAP.get(symbol, f"{symbol}.NS")
+
 # ================== BLACK-SCHOLES GREEKS ==================
 
-def black_scholes_greeks(S, K, T, r, sigma, option_type='CE'):
+_INV_SQRT_2PI = 0.3989422804014327  # 1 / sqrt(2*pi)
+
+_SQRT2 = 1.4142135623730951
+
+# Explicit signatures compile at import (loaded from the on-disk cache after
+# the first run) instead of on the first Greeks call
+@njit("float64(float64)", cache=True, fastmath=True)
+def _Phi(x):
+    """Standard normal CDF (erfc form keeps precision in the lower tail)"""
+    return 0.5 * math.erfc(-x / _SQRT2)
+
+@njit("float64(float64)", cache=True, fastmath=True)
+def _phi(x):
+    """Standard normal PDF"""
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+@njit("UniTuple(float64, 8)(float64, float64, float64, float64, float64, boolean)",
+      cache=True, fastmath=True)
+def _bs_core(S, K, T, r, sigma, is_call):
     """
-    Calculate Option Greeks using Black-Scholes model.
+    Scalar Black-Scholes kernel (compiled by numba when available).
     
-    Parameters:
-    -----------
-    S : float - Current spot price
-    K : float - Strike price
-    T : float - Time to expiry in years (DTE/365)
-    r : float - Risk-free interest rate (e.g., 0.065 for 6.5%)
-    sigma : float - Implied Volatility (e.g., 0.20 for 20%)
-    option_type : str - 'CE' for Call, 'PE' for Put
-    
-    Returns:
-    --------
-    dict with: price, delta, gamma, theta, vega, rho
+    Returns (price, delta, gamma, theta, vega, rho, d1, d2), unrounded.
+    The normal CDF/PDF come from _Phi/_phi, so it needs no scipy.
     """
-    
     if T <= 0:
         T = 0.0001  # Avoid division by zero
     
     if sigma <= 0:
         sigma = 0.01  # Minimum volatility
     
+    # Terms reused across the price and every Greek
+    sqrtT = math.sqrt(T)
+    sig_sqrtT = sigma * sqrtT
+    disc = math.exp(-r * T)
+    log_SK = math.log(S / K)
+    
     # Calculate d1 and d2
-    d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-    d2 = d1 - sigma * math.sqrt(T)
+    d1 = (log_SK + (r + 0.5 * sigma * sigma) * T) / sig_sqrtT
+    d2 = d1 - sig_sqrtT
     
-    # Standard normal CDF and PDF
-    N_d1 = norm.cdf(d1)
-    N_d2 = norm.cdf(d2)
-    N_neg_d1 = norm.cdf(-d1)
-    N_neg_d2 = norm.cdf(-d2)
-    n_d1 = norm.pdf(d1)  # Standard normal PDF
+    # Standard normal PDF and the terms shared by both branches
+    n_d1 = _phi(d1)
+    theta_decay = -S * n_d1 * sigma / (2 * sqrtT)
+    K_disc = K * disc
     
-    if option_type.upper() == 'CE':
+    # Each branch evaluates only the two CDFs it needs
+    if is_call:
         # Call option
-        price = S * N_d1 - K * math.exp(-r * T) * N_d2
+        N_d1 = _Phi(d1)
+        N_d2 = _Phi(d2)
+        price = S * N_d1 - K_disc * N_d2
         delta = N_d1
-        theta = (-S * n_d1 * sigma / (2 * math.sqrt(T)) 
-                 - r * K * math.exp(-r * T) * N_d2) / 365  # Daily theta
-        rho = K * T * math.exp(-r * T) * N_d2 / 100  # Per 1% change
+        theta = (theta_decay - r * K_disc * N_d2) / 365  # Daily theta
+        rho = K_disc * T * N_d2 / 100  # Per 1% change
     else:
         # Put option
-        price = K * math.exp(-r * T) * N_neg_d2 - S * N_neg_d1
-        delta = N_d1 - 1  # Negative for puts
-        theta = (-S * n_d1 * sigma / (2 * math.sqrt(T)) 
-                 + r * K * math.exp(-r * T) * N_neg_d2) / 365  # Daily theta
-        rho = -K * T * math.exp(-r * T) * N_neg_d2 / 100
+        N_neg_d1 = _Phi(-d1)
+        N_neg_d2 = _Phi(-d2)
+        price = K_disc * N_neg_d2 - S * N_neg_d1
+        delta = -N_neg_d1  # N(d1) - 1, negative for puts
+        theta = (theta_decay + r * K_disc * N_neg_d2) / 365  # Daily theta
+        rho = -K_disc * T * N_neg_d2 / 100
     
     # Greeks common to both
-    gamma = n_d1 / (S * sigma * math.sqrt(T))
-    vega = S * n_d1 * math.sqrt(T) / 100  # Per 1% change in IV
+    gamma = n_d1 / (S * sig_sqrtT)
+    vega = S * n_d1 * sqrtT / 100  # Per 1% change in IV
+    
+    return price, delta, gamma, theta, vega, rho, d1, d2
+
+if GREEKS_AOT_AVAILABLE:
+    _bs_core = _bs_core_aot
+
+class Greeks(NamedTuple):
+    """Black-Scholes price and Greeks for a single option"""
+    theoretical_price: float
+    delta: float
+    gamma: float
+    theta: float  # Daily theta in ₹
+    vega: float   # Change per 1% IV move
+    rho: float    # Change per 1% rate move
+    d1: float
+    d2: float
+
+def black_scholes_greeks_vec(S, K, T, r, sigma, is_call):
+    """
+    Vectorized Black-Scholes Greeks for a whole set of options in one call.
+    
+    Parameters:
+    -----------
+    S, K, T, sigma : array-like (broadcastable) - as in black_scholes_greeks
+    r : float - Risk-free interest rate
+    is_call : array-like of bool - True for Call, False for Put
+    
+    Returns:
+    --------
+    dict of np.ndarray (unrounded) with: theoretical_price, delta, gamma,
+    theta, vega, rho, d1, d2
+    """
+    S = np.asarray(S, dtype=float)
+    K = np.asarray(K, dtype=float)
+    T = np.asarray(T, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    is_call = np.asarray(is_call, dtype=bool)
+    
+    T = np.where(T <= 0, 0.0001, T)              # Avoid division by zero
+    sigma = np.where(sigma <= 0, 0.01, sigma)    # Minimum volatility
+    
+    log_SK, sqrtT, disc = np.log(S / K), np.sqrt(T), np.exp(-r * T)
+    price, _, d1, d2 = _bs_price_vega(S, K, T, r, sigma, is_call, log_SK, sqrtT, disc)
+    return _bs_greeks_from_parts(S, K, T, r, sigma, is_call, price, d1, d2, sqrtT, disc)
+
+def _bs_greeks_from_parts(S, K, T, r, sigma, is_call, price, d1, d2, sqrtT, disc):
+    """
+    Finish the Greeks from an already-evaluated price and its intermediates
+    (d1, d2, sqrt(T), exp(-rT)), so callers that priced the option don't
+    recompute them. Returns the same dict as black_scholes_greeks_vec.
+    """
+    from scipy.special import ndtr
+    
+    N_d1 = ndtr(d1)
+    N_d2 = ndtr(d2)
+    N_neg_d2 = ndtr(-d2)
+    n_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    
+    delta = np.where(is_call, N_d1, N_d1 - 1)
+    theta_decay = -S * n_d1 * sigma / (2 * sqrtT)
+    theta = np.where(is_call,
+                     theta_decay - r * K * disc * N_d2,
+                     theta_decay + r * K * disc * N_neg_d2) / 365  # Daily theta
+    rho = np.where(is_call, K * T * disc * N_d2, -K * T * disc * N_neg_d2) / 100
+    
+    gamma = n_d1 / (S * sigma * sqrtT)
+    vega = S * n_d1 * sqrtT / 100  # Per 1% change in IV
     
     return {
-        'theoretical_price': round(price, 2),
-        'delta': round(delta, 4),
-        'gamma': round(gamma, 6),
-        'theta': round(theta, 2),  # Daily theta in ₹
-        'vega': round(vega, 2),    # Change per 1% IV move
-        'rho': round(rho, 4),
-        'd1': round(d1, 4),
-        'd2': round(d2, 4)
+        'theoretical_price': price,
+        'delta': delta,
+        'gamma': gamma,
+        'theta': theta,
+        'vega': vega,
+        'rho': rho,
+        'd1': d1,
+        'd2': d2
     }
 
+def black_scholes_greeks(S, K, T, r, sigma, option_type='CE'):
+    """
+    Calculate Option Greeks using Black-Scholes model.
+    
+    Parameters:
+    -----------
+    S : float - Current spot price
+    K : float - Strike price
+    T : float - Time to expiry in years (DTE/365)
+    r : float - Risk-free interest rate (e.g., 0.065 for 6.5%)
+    sigma : float - Implied Volatility (e.g., 0.20 for 20%)
+    option_type : str - 'CE' for Call, 'PE' for Put
+    
+    Returns:
+    --------
+    Greeks (unrounded; round for display only)
+    """
+    return Greeks(*_bs_core(
+        float(S), float(K), float(T), float(r), float(sigma), option_type.upper() == 'CE'
+    ))
+
+def _bs_price_vega(S, K, T, r, sigma, is_call, log_SK, sqrtT, disc):
+    """
+    Black-Scholes price and vega (per unit sigma) - the two values the IV
+    solver needs - plus d1 and d2 so the remaining Greeks can be finished
+    without recomputing them. log(S/K), sqrt(T) and exp(-rT) don't depend
+    on sigma, so the caller computes them once and passes them in.
+    Works on scalars or arrays.
+    """
+    from scipy.special import ndtr
+    
+    sig_sqrtT = sigma * sqrtT
+    d1 = (log_SK + (r + 0.5 * sigma * sigma) * T) / sig_sqrtT
+    d2 = d1 - sig_sqrtT
+    price = np.where(is_call,
+                     S * ndtr(d1) - K * disc * ndtr(d2),
+                     K * disc * ndtr(-d2) - S * ndtr(-d1))
+    vega = S * np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI * sqrtT
+    return price, vega, d1, d2
+
 def calculate_iv_from_premium(S, K, T, r, market_price, option_type='CE'):
     """
-    Calculate Implied Volatility from market price using Newton-Raphson method.
+    Calculate Implied Volatility (%) from market price, together with the
+    Greeks at that volatility.
+    
+    Halley's method (Newton on analytical vega with a volga curvature
+    correction), safeguarded by a bisection bracket:
+    each iteration shrinks [lo, hi] around the root, and any Newton step
+    that leaves the bracket (or has vanishing vega) is replaced by the
+    bracket midpoint. Options still unconverged after IV_NEWTON_ITERS steps
+    are finished with scipy's brentq on their remaining bracket. Accepts
+    scalars or arrays, so a whole chain can be solved in one call;
+    option_type may be a string or array of 'CE'/'PE'.
+    
+    The Greeks are finished from the last pricing evaluation, so callers
+    don't need a separate black_scholes_greeks call.
+    
+    Returns:
+    --------
+    (iv_pct, greeks) - a float and a Greeks tuple (as black_scholes_greeks)
+    for scalar input, or an array and a dict of arrays
+    (as black_scholes_greeks_vec) for array input
     """
-    sigma = 0.3  # Initial guess
+    scalar_input = all(np.ndim(x) == 0 for x in (S, K, T, market_price, option_type))
     
-    for _ in range(100):
-        greeks = black_scholes_greeks(S, K, T, r, sigma, option_type)
-        price = greeks['theoretical_price']
-        vega = greeks['vega'] * 100  # Convert back
-        
-        if vega < 0.0001:
-            break
+    S, K, T, market_price = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, T, market_price))
+    )
+    is_call = np.broadcast_to(np.char.upper(np.asarray(option_type, dtype=str)) == 'CE', S.shape)
+    T = np.where(T <= 0, 0.0001, T)
+    
+    # Independent of sigma, so computed once rather than per iteration
+    log_SK, sqrtT, disc = np.log(S / K), np.sqrt(T), np.exp(-r * T)
+    
+    lo = np.full(S.shape, 1e-4)
+    hi = np.full(S.shape, 5.0)
+    
+    # Inflection-point initial guess; fall back to 30% when it's degenerate
+    sigma = np.sqrt(np.abs(2.0 / T * (log_SK + r * T)))
+    sigma = np.where((sigma > lo) & (sigma < hi), sigma, 0.3)
+    
+    active = np.ones(S.shape, dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(IV_NEWTON_ITERS):
+            price, vega, d1, d2 = _bs_price_vega(S, K, T, r, sigma, is_call, log_SK, sqrtT, disc)
+            diff = price - market_price
+            active &= np.abs(diff) >= 1e-6
+            if not active.any():
+                break
             
-        diff = market_price - price
-        if abs(diff) < 0.01:
-            break
+            # Price is increasing in sigma, so the sign of diff picks the side
+            hi = np.where(active & (diff > 0), sigma, hi)
+            lo = np.where(active & (diff < 0), sigma, lo)
             
-        sigma = sigma + diff / vega
-        sigma = max(0.01, min(sigma, 3.0))  # Bound between 1% and 300%
+            # Halley step: the Newton step corrected for price curvature via
+            # volga / vega = d1 * d2 / sigma (both already computed). From the
+            # inflection-point seed plain Newton is monotone but crawls;
+            # if the correction would more than double the step, keep Newton.
+            step = diff / vega
+            denom = 1.0 - 0.5 * step * d1 * d2 / sigma
+            newton = sigma - np.where(denom > 0.5, step / denom, step)
+            use_bisect = (vega < 1e-8) | ~((newton > lo) & (newton < hi))
+            sigma = np.where(active, np.where(use_bisect, 0.5 * (lo + hi), newton), sigma)
+        else:
+            # Stragglers: Brent's method on the bracket Newton left behind.
+            # No sign change means the premium is outside the attainable
+            # range, so sigma goes to the bracket edge nearest to it.
+            from scipy.optimize import brentq
+            for i in np.flatnonzero(active):
+                S_i, K_i, T_i, call_i = S.flat[i], K.flat[i], T.flat[i], is_call.flat[i]
+                consts = (log_SK.flat[i], sqrtT.flat[i], disc.flat[i])
+                f = lambda s: float(_bs_price_vega(S_i, K_i, T_i, r, s, call_i, *consts)[0]) - market_price.flat[i]
+                f_lo, f_hi = f(lo.flat[i]), f(hi.flat[i])
+                if f_lo * f_hi < 0:
+                    sigma.flat[i] = brentq(f, lo.flat[i], hi.flat[i], xtol=1e-6, maxiter=50)
+                else:
+                    sigma.flat[i] = lo.flat[i] if f_lo >= 0 else hi.flat[i]
+            price, vega, d1, d2 = _bs_price_vega(S, K, T, r, sigma, is_call, log_SK, sqrtT, disc)
+    
+    greeks = _bs_greeks_from_parts(S, K, T, r, sigma, is_call, price, d1, d2, sqrtT, disc)
     
-    return round(sigma * 100, 2)  # Return as percentage
+    # Return as percentage (unrounded; round for display only)
+    if scalar_input:
+        return float(sigma) * 100, Greeks(*(float(greeks[f]) for f in Greeks._fields))
+    return sigma * 100, greeks
+
+# ================== JOURNAL STORAGE ==================
+
+def _json_dumps(obj, indent=False):
+    """Serialize to JSON bytes (orjson when installed, else stdlib json)"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
+def _json_loads(raw):
+    """Parse JSON bytes (orjson when installed, else stdlib json)"""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
 # ================== PAPER TRADE TRACKER CLASS ==================
 
@@ -143,37 +385,182 @@ class PaperTradeTracker:
     
     def __init__(self):
         self.trades = []
+        # trade id -> trade dict, kept in step with self.trades
+        self._id_index = {}
+        # Column arrays aligned with self.trades for vectorized aggregates
+        self._arr = {}
+        # symbol -> (monotonic fetch time, price)
+        self._price_cache = {}
         self.load_trades()
     
     def load_trades(self):
-        """Load trades from JSON file"""
+        """Load trades from JSON file and their history from the history log"""
         if os.path.exists(TRADES_FILE):
-            with open(TRADES_FILE, 'r') as f:
-                self.trades = json.load(f)
+            with open(TRADES_FILE, 'rb') as f:
+                raw = f.read()
+            self.trades = _json_loads(raw)
+            # Older journals only carry the expiry as a date string
+            for trade in self.trades:
+                if 'expiry_epoch_day' not in trade:
+                    trade['expiry_epoch_day'] = datetime.strptime(
+                        trade['expiry_date'], '%Y-%m-%d').toordinal()
             print(f"✓ Loaded {len(self.trades)} existing trades")
         else:
             self.trades = []
+            # The history log is keyed by trade id and ids restart at 1, so a
+            # log left over from a deleted journal would attach to new trades
+            if os.path.exists(HISTORY_NDJSON):
+                os.replace(HISTORY_NDJSON, HISTORY_NDJSON + ".old")
+                print(f"✓ No {TRADES_FILE}; moved old history log to {HISTORY_NDJSON}.old")
+        self._id_index = {t['id']: t for t in self.trades}
+        self._rebuild_arrays()
+        self._load_history()
+    
+    def _rebuild_arrays(self):
+        """Rebuild the column arrays (self._arr) from self.trades"""
+        trades = self.trades
+        self._arr = {
+            'id': np.array([t['id'] for t in trades], dtype=np.int64),
+            'symbol': np.array([t['symbol'] for t in trades], dtype=object),
+            'strike': np.array([t['strike'] for t in trades], dtype=float),
+            'iv': np.array([t.get('entry_iv', 25) for t in trades], dtype=float),
+            'expiry_ord': np.array([t['expiry_epoch_day'] for t in trades], dtype=np.int64),
+            'lot_size': np.array([t['lot_size'] for t in trades], dtype=float),
+            'is_call': np.array([t['option_type'] == 'CE' for t in trades], dtype=bool),
+            'open': np.array([t['status'] == 'OPEN' for t in trades], dtype=bool),
+        }
+    
+    def _append_arrays(self, trade):
+        """Append one trade's row to the column arrays"""
+        row = {
+            'id': trade['id'],
+            'symbol': trade['symbol'],
+            'strike': trade['strike'],
+            'iv': trade['entry_iv'],
+            'expiry_ord': trade['expiry_epoch_day'],
+            'lot_size': trade['lot_size'],
+            'is_call': trade['option_type'] == 'CE',
+            'open': trade['status'] == 'OPEN',
+        }
+        for key, value in row.items():
+            col = self._arr[key]
+            self._arr[key] = np.append(col, np.array([value], dtype=col.dtype))
+    
+    def _load_history(self):
+        """Rebuild each trade's history list from HISTORY_NDJSON"""
+        # Journals written before the split embed history in the trades file;
+        # move it into the log once so it survives the next save
+        legacy = [t for t in self.trades if t.get('history')]
+        if legacy and not os.path.exists(HISTORY_NDJSON):
+            with open(HISTORY_NDJSON, 'ab') as f:
+                for trade in legacy:
+                    for entry in trade['history']:
+                        f.write(_json_dumps({'trade_id': trade['id'], **entry}) + b'\n')
+        
+        for trade in self.trades:
+            trade['history'] = []
+        
+        if not self.trades or not os.path.exists(HISTORY_NDJSON):
+            return
+        
+        with open(HISTORY_NDJSON, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    continue  # Blank or partially written line
+                trade = self._id_index.get(entry.pop('trade_id', None))
+                if trade is not None:
+                    trade['history'].append(entry)
+    
+    def _append_history(self, trade, entry):
+        """Add a history entry to the trade and append it to the history log"""
+        trade['history'].append(entry)
+        with open(HISTORY_NDJSON, 'ab') as f:
+            f.write(_json_dumps({'trade_id': trade['id'], **entry}) + b'\n')
     
     def save_trades(self):
-        """Save trades to JSON file"""
-        with open(TRADES_FILE, 'w') as f:
-            json.dump(self.trades, f, indent=2, default=str)
+        """
+        Save current trade state to JSON file (written to a temp file, then
+        swapped in). History lives in HISTORY_NDJSON and is not rewritten.
+        """
+        data = _json_dumps(
+            [{k: v for k, v in t.items() if k != 'history'} for t in self.trades],
+            indent=True
+        )
+        
+        # os.replace is atomic, so an interrupted save never leaves a
+        # half-written trades file behind
+        tmp = TRADES_FILE + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, TRADES_FILE)
         print(f"✓ Saved {len(self.trades)} trades to {TRADES_FILE}")
     
     def get_spot_price(self, symbol):
-        """Fetch current spot price"""
+        """Fetch current spot price (cached for SPOT_CACHE_TTL seconds)"""
+        now = time.monotonic()
+        ts, price = self._price_cache.get(symbol, (0, None))
+        if price is not None and now - ts < SPOT_CACHE_TTL:
+            return price
+        
+        import yfinance as yf
+        
         try:
-            ticker = SYMBOL_MAP.get(symbol, f"{symbol}.NS")
-            data = yf.Ticker(ticker).history(period="1d", interval="5m")
-            if not data.empty:
-                return round(data['Close'].iloc[-1], 2)
+            tk = yf.Ticker(_yf_ticker(symbol))
+            
+            # Quote endpoint first; the intraday bars are only a fallback
+            try:
+                last = tk.fast_info.get('last_price')
+            except Exception:
+                last = None
+            
+            if last is None or last != last:  # None or NaN
+                data = tk.history(period="1d", interval="5m")
+                if data.empty:
+                    return None
+                last = data['Close'].iloc[-1]
+            
+            price = round(float(last), 2)
+            self._price_cache[symbol] = (now, price)
+            return price
         except Exception as e:
             print(f"Error fetching price for {symbol}: {e}")
         return None
     
+    def prefetch_spot_prices(self, symbols):
+        """Fetch spot prices for several symbols in one batched download"""
+        now = time.monotonic()
+        pending = {}  # Yahoo ticker -> symbol
+        for symbol in set(symbols):
+            ts, price = self._price_cache.get(symbol, (0, None))
+            if price is None or now - ts >= SPOT_CACHE_TTL:
+                pending[_yf_ticker(symbol)] = symbol
+        
+        if not pending:
+            return
+        
+        import yfinance as yf
+        
+        try:
+            data = yf.download(list(pending), period="1d", interval="5m",
+                               group_by='ticker', threads=True, progress=False)
+        except Exception as e:
+            print(f"Error batch-fetching prices: {e}")
+            return
+        
+        # Symbols missing from the batch fall back to get_spot_price
+        for ticker, symbol in pending.items():
+            try:
+                closes = data[ticker]['Close'].dropna()
+            except KeyError:
+                continue
+            if not closes.empty:
+                self._price_cache[symbol] = (now, round(float(closes.iloc[-1]), 2))
+    
     def get_lot_size(self, symbol):
         """Get lot size for symbol"""
-        return LOT_SIZES.get(symbol, 500)
+        return _lot_size(symbol)
     
     def add_trade(self, symbol, strike, option_type, entry_premium, 
                   iv=None, dte=None, notes=""):
@@ -195,24 +582,23 @@ class PaperTradeTracker:
             print(f"❌ Could not fetch spot price for {symbol}")
             return None
         
-        lot_size = self.get_lot_size(symbol)
+        lot_size = _lot_size(symbol)
         
         # Calculate expiry date
-        if dte:
-            expiry_date = (datetime.now() + timedelta(days=dte)).strftime('%Y-%m-%d')
-        else:
+        if not dte:
             dte = 30  # Default
-            expiry_date = (datetime.now() + timedelta(days=dte)).strftime('%Y-%m-%d')
+        expiry = datetime.now().date() + timedelta(days=dte)
+        expiry_date = expiry.strftime('%Y-%m-%d')
         
         # Calculate IV if not provided
         T = dte / 365
+        # (the IV solve also returns the entry Greeks)
         if iv is None:
-            iv = calculate_iv_from_premium(spot, strike, T, RISK_FREE_RATE, 
-                                          entry_premium, option_type)
-        
-        # Calculate entry Greeks
-        greeks = black_scholes_greeks(spot, strike, T, RISK_FREE_RATE, 
-                                      iv/100, option_type)
+            iv, greeks = calculate_iv_from_premium(spot, strike, T, RISK_FREE_RATE, 
+                                                  entry_premium, option_type)
+        else:
+            greeks = black_scholes_greeks(spot, strike, T, RISK_FREE_RATE, 
+                                          iv/100, option_type)
         
         trade = {
             'id': len(self.trades) + 1,
@@ -225,6 +611,7 @@ class PaperTradeTracker:
             'entry_iv': iv,
             'dte_at_entry': dte,
             'expiry_date': expiry_date,
+            'expiry_epoch_day': expiry.toordinal(),
             'lot_size': lot_size,
             'total_cost': round(entry_premium * lot_size, 2),
             'status': 'OPEN',
@@ -234,18 +621,21 @@ class PaperTradeTracker:
             'pnl': 0,
             'pnl_pct': 0,
             'notes': notes,
-            'entry_greeks': greeks,
-            'history': [{
-                'date': datetime.now().strftime('%Y-%m-%d'),
-                'spot': spot,
-                'premium': entry_premium,
-                'iv': iv,
-                'dte': dte,
-                'greeks': greeks
-            }]
+            'entry_greeks': greeks._asdict(),
+            'history': []
         }
         
         self.trades.append(trade)
+        self._id_index[trade['id']] = trade
+        self._append_arrays(trade)
+        self._append_history(trade, {
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'spot': spot,
+            'premium': entry_premium,
+            'iv': iv,
+            'dte': dte,
+            'greeks': greeks._asdict()
+        })
         self.save_trades()
         
         self._print_trade_summary(trade, "NEW TRADE ADDED")
@@ -268,8 +658,7 @@ class PaperTradeTracker:
             return
         
         # Calculate current DTE
-        expiry = datetime.strptime(trade['expiry_date'], '%Y-%m-%d')
-        dte = max(0, (expiry - datetime.now()).days)
+        dte = max(0, trade['expiry_epoch_day'] - datetime.now().toordinal())
         T = max(dte, 1) / 365
         
         # If premium not provided, estimate from Greeks
@@ -280,13 +669,9 @@ class PaperTradeTracker:
             delta = trade['entry_greeks']['delta']
             current_premium = max(0.05, last_premium + (spot_change * delta))
         
-        # Calculate current IV
-        iv = calculate_iv_from_premium(spot, trade['strike'], T, RISK_FREE_RATE,
-                                       current_premium, trade['option_type'])
-        
-        # Calculate current Greeks
-        greeks = black_scholes_greeks(spot, trade['strike'], T, RISK_FREE_RATE,
-                                      iv/100, trade['option_type'])
+        # Calculate current IV and Greeks
+        iv, greeks = calculate_iv_from_premium(spot, trade['strike'], T, RISK_FREE_RATE,
+                                               current_premium, trade['option_type'])
         
         # Calculate P&L
         pnl_per_unit = current_premium - trade['entry_premium']
@@ -300,13 +685,13 @@ class PaperTradeTracker:
             trade['notes'] = notes
         
         # Add to history
-        trade['history'].append({
+        self._append_history(trade, {
             'date': datetime.now().strftime('%Y-%m-%d'),
             'spot': spot,
             'premium': round(current_premium, 2),
             'iv': iv,
             'dte': dte,
-            'greeks': greeks,
+            'greeks': greeks._asdict(),
             'pnl': pnl,
             'pnl_pct': pnl_pct
         })
@@ -333,6 +718,7 @@ class PaperTradeTracker:
         pnl_pct = round((pnl_per_unit / trade['entry_premium']) * 100, 2)
         
         trade['status'] = 'CLOSED'
+        self._arr['open'][self._arr['id'] == trade_id] = False
         trade['exit_date'] = datetime.now().strftime('%Y-%m-%d %H:%M')
         trade['exit_premium'] = exit_premium
         trade['exit_spot'] = spot
@@ -364,35 +750,40 @@ class PaperTradeTracker:
             print("No trades found")
             return
         
-        print("\n" + "=" * 100)
-        print("PAPER TRADE PORTFOLIO")
-        print("=" * 100)
-        print(f"\n{'#':<3} {'SYMBOL':<12} {'TYPE':<6} {'STRIKE':<10} {'ENTRY':<10} {'CURRENT P&L':<15} {'STATUS':<8} {'DTE':<5}")
-        print("-" * 100)
+        # Build the whole table, then write it out once
+        rows = [
+            "\n" + "=" * 100,
+            "PAPER TRADE PORTFOLIO",
+            "=" * 100,
+            f"\n{'#':<3} {'SYMBOL':<12} {'TYPE':<6} {'STRIKE':<10} {'ENTRY':<10} {'CURRENT P&L':<15} {'STATUS':<8} {'DTE':<5}",
+            "-" * 100,
+        ]
         
         total_pnl = 0
+        today_ord = datetime.now().toordinal()
         for trade in trades:
-            expiry = datetime.strptime(trade['expiry_date'], '%Y-%m-%d')
-            dte = max(0, (expiry - datetime.now()).days)
+            dte = max(0, trade['expiry_epoch_day'] - today_ord)
             
             pnl_str = f"₹{trade['pnl']:+,.0f} ({trade['pnl_pct']:+.1f}%)"
             opt_type = "Call" if trade['option_type'] == 'CE' else "Put"
             
-            print(f"{trade['id']:<3} {trade['symbol']:<12} {opt_type:<6} {trade['strike']:<10} "
-                  f"₹{trade['entry_premium']:<9} {pnl_str:<15} {trade['status']:<8} {dte:<5}")
+            rows.append(f"{trade['id']:<3} {trade['symbol']:<12} {opt_type:<6} {trade['strike']:<10} "
+                        f"₹{trade['entry_premium']:<9} {pnl_str:<15} {trade['status']:<8} {dte:<5}")
             
             if trade['status'] == 'OPEN':
                 total_pnl += trade['pnl']
         
-        print("-" * 100)
-        print(f"Total Open P&L: ₹{total_pnl:+,.0f}")
-        print("=" * 100)
+        rows.append("-" * 100)
+        rows.append(f"Total Open P&L: ₹{total_pnl:+,.0f}")
+        rows.append("=" * 100)
+        sys.stdout.write("\n".join(rows) + "\n")
     
     def calculate_portfolio_greeks(self):
         """Calculate aggregate Greeks for all open positions"""
-        open_trades = [t for t in self.trades if t['status'] == 'OPEN']
+        arr = self._arr
+        open_idx = np.flatnonzero(arr['open'])
         
-        if not open_trades:
+        if not open_idx.size:
             print("No open trades")
             return
         
@@ -407,35 +798,39 @@ class PaperTradeTracker:
         print(f"\n{'SYMBOL':<12} {'TYPE':<6} {'STRIKE':<10} {'LOTS':<6} {'DELTA':<10} {'GAMMA':<10} {'THETA':<10} {'VEGA':<10}")
         print("-" * 100)
         
-        for trade in open_trades:
-            spot = self.get_spot_price(trade['symbol'])
-            if not spot:
-                continue
-            
-            expiry = datetime.strptime(trade['expiry_date'], '%Y-%m-%d')
-            dte = max(1, (expiry - datetime.now()).days)
-            T = dte / 365
-            
-            iv = trade.get('entry_iv', 25) / 100
-            greeks = black_scholes_greeks(spot, trade['strike'], T, 
-                                          RISK_FREE_RATE, iv, trade['option_type'])
-            
-            lot_size = trade['lot_size']
+        # One download for all distinct symbols instead of one request per trade
+        symbols = set(arr['symbol'][open_idx])
+        self.prefetch_spot_prices(symbols)
+        spot_by_symbol = {sym: self.get_spot_price(sym) for sym in symbols}
+        
+        # Positions whose spot couldn't be fetched are skipped
+        spots = np.array([spot_by_symbol[sym] or np.nan for sym in arr['symbol'][open_idx]])
+        has_spot = ~np.isnan(spots)
+        idx = open_idx[has_spot]
+        priced = [self.trades[i] for i in idx]
+        
+        if priced:
+            T = np.maximum(1, arr['expiry_ord'][idx] - datetime.now().toordinal()) / 365
+            greeks = black_scholes_greeks_vec(spots[has_spot], arr['strike'][idx], T,
+                                              RISK_FREE_RATE, arr['iv'][idx] / 100,
+                                              arr['is_call'][idx])
+            lot_sizes = arr['lot_size'][idx]
             
             # Position Greeks (multiply by lot size)
-            pos_delta = greeks['delta'] * lot_size
-            pos_gamma = greeks['gamma'] * lot_size
-            pos_theta = greeks['theta'] * lot_size
-            pos_vega = greeks['vega'] * lot_size
+            pos_delta = greeks['delta'] * lot_sizes
+            pos_gamma = greeks['gamma'] * lot_sizes
+            pos_theta = greeks['theta'] * lot_sizes
+            pos_vega = greeks['vega'] * lot_sizes
             
-            total_delta += pos_delta
-            total_gamma += pos_gamma
-            total_theta += pos_theta
-            total_vega += pos_vega
+            total_delta = pos_delta.sum()
+            total_gamma = pos_gamma.sum()
+            total_theta = pos_theta.sum()
+            total_vega = pos_vega.sum()
             
-            opt_type = "Call" if trade['option_type'] == 'CE' else "Put"
-            print(f"{trade['symbol']:<12} {opt_type:<6} {trade['strike']:<10} {lot_size:<6} "
-                  f"{pos_delta:<10.2f} {pos_gamma:<10.4f} {pos_theta:<10.2f} {pos_vega:<10.2f}")
+            for i, trade in enumerate(priced):
+                opt_type = "Call" if trade['option_type'] == 'CE' else "Put"
+                print(f"{trade['symbol']:<12} {opt_type:<6} {trade['strike']:<10} {trade['lot_size']:<6} "
+                      f"{pos_delta[i]:<10.2f} {pos_gamma[i]:<10.4f} {pos_theta[i]:<10.2f} {pos_vega[i]:<10.2f}")
         
         print("-" * 100)
         print(f"{'TOTAL':<12} {'':<6} {'':<10} {'':<6} "
@@ -457,10 +852,7 @@ class PaperTradeTracker:
     
     def _get_trade(self, trade_id):
         """Get trade by ID"""
-        for trade in self.trades:
-            if trade['id'] == trade_id:
-                return trade
-        return None
+        return self._id_index.get(trade_id)
     
     def _print_trade_summary(self, trade, title):
         """Print trade summary"""
@@ -494,8 +886,8 @@ class PaperTradeTracker:
         print(f"  P&L: ₹{pnl:+,.0f} ({pnl_pct:+.1f}%)")
         print("-" * 70)
         print("  CURRENT GREEKS:")
-        print(f"    Delta: {greeks['delta']:+.4f} | Gamma: {greeks['gamma']:.6f}")
-        print(f"    Theta: ₹{greeks['theta']:.2f}/day | Vega: ₹{greeks['vega']:.2f}/1% IV")
+        print(f"    Delta: {greeks.delta:+.4f} | Gamma: {greeks.gamma:.6f}")
+        print(f"    Theta: ₹{greeks.theta:.2f}/day | Vega: ₹{greeks.vega:.2f}/1% IV")
         print("-" * 70)
     
     def _print_trade_close(self, trade):
@@ -645,6 +1037,11 @@ def explain_greeks():
     print(explanation)
 
 
+# Scenario grids for show_greeks_impact
+SPOT_MOVE_SCENARIOS = np.array([-200, -100, -50, 50, 100, 200])
+THETA_DAY_SCENARIOS = np.array([1, 3, 5, 7, 14])
+IV_CHANGE_SCENARIOS = np.array([-5, -3, -1, 1, 3, 5])
+
 def show_greeks_impact(spot, strike, premium, dte, iv, option_type='PE'):
     """
     Show how Greeks impact your position in different scenarios.
@@ -662,33 +1059,34 @@ def show_greeks_impact(spot, strike, premium, dte, iv, option_type='PE'):
     
     print(f"\n  CURRENT GREEKS (per unit):")
     print(f"  {'─'*40}")
-    print(f"  Delta: {greeks['delta']:+.4f}")
-    print(f"  Gamma: {greeks['gamma']:.6f}")
-    print(f"  Theta: ₹{greeks['theta']:.2f}/day")
-    print(f"  Vega:  ₹{greeks['vega']:.2f}/1% IV")
+    print(f"  Delta: {greeks.delta:+.4f}")
+    print(f"  Gamma: {greeks.gamma:.6f}")
+    print(f"  Theta: ₹{greeks.theta:.2f}/day")
+    print(f"  Vega:  ₹{greeks.vega:.2f}/1% IV")
     
     print(f"\n  SCENARIO ANALYSIS (1 lot = {lot_size} units):")
     print(f"  {'─'*70}")
     
+    # P&L for every scenario in one broadcast each; the loops only print
+    daily_decay = greeks.theta * lot_size
+    days = THETA_DAY_SCENARIOS[THETA_DAY_SCENARIOS <= dte]
+    spot_pnl = SPOT_MOVE_SCENARIOS * (greeks.delta * lot_size)
+    theta_pnl = days * daily_decay
+    iv_pnl = IV_CHANGE_SCENARIOS * (greeks.vega * lot_size)
+    
     # Scenario 1: Spot moves
     print(f"\n  📈 IF SPOT MOVES (assuming IV unchanged):")
-    for move in [-200, -100, -50, +50, +100, +200]:
-        pnl = greeks['delta'] * move * lot_size
+    for move, pnl in zip(SPOT_MOVE_SCENARIOS.tolist(), spot_pnl.tolist()):
         print(f"      Spot {move:+4d} points → P&L: ₹{pnl:+,.0f}")
     
     # Scenario 2: Time passes
     print(f"\n  ⏰ IF TIME PASSES (assuming spot unchanged):")
-    daily_decay = greeks['theta'] * lot_size
-    for days in [1, 3, 5, 7, 14]:
-        if days <= dte:
-            pnl = daily_decay * days
-            print(f"      After {days:2d} days → P&L: ₹{pnl:+,.0f} (theta decay)")
+    for n_days, pnl in zip(days.tolist(), theta_pnl.tolist()):
+        print(f"      After {n_days:2d} days → P&L: ₹{pnl:+,.0f} (theta decay)")
     
     # Scenario 3: IV changes
     print(f"\n  📊 IF IV CHANGES (assuming spot unchanged):")
-    iv_impact = greeks['vega'] * lot_size
-    for iv_change in [-5, -3, -1, +1, +3, +5]:
-        pnl = iv_change * iv_impact
+    for iv_change, pnl in zip(IV_CHANGE_SCENARIOS.tolist(), iv_pnl.tolist()):
         print(f"      IV {iv_change:+2d}% → P&L: ₹{pnl:+,.0f}")
     
     print(f"\n  {'─'*70}")
@@ -839,8 +1237,6 @@ def quick_start_demo():
 
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) > 1 and sys.argv[1] == 'demo':
         quick_start_demo()
     else:
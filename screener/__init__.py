@@ -20,14 +20,42 @@ Usage:
     from screener.iv import set_opstra_cookies
 """
 
-from screener.main import job, run_scheduler, run_scan_with_config
-from screener.config import STOCK_SYMBOLS, INDEX_SYMBOLS
-from screener.scanners import scan_stock, scan_index
-from screener.iv import set_opstra_cookies, is_opstra_configured, get_iv_data
-from screener.api import is_market_hours, get_india_vix, determine_market_regime
+import importlib
 
 __version__ = "3.3.0"
 
+# Public names -> defining module. Imported on first access (PEP 562), so
+# e.g. `from screener import is_market_hours` doesn't load yfinance,
+# pandas and the scheduler through screener.main.
+_LAZY_ATTRS = {
+    "job": "screener.main",
+    "run_scheduler": "screener.main",
+    "run_scan_with_config": "screener.main",
+    "scan_stock": "screener.scanners",
+    "scan_index": "screener.scanners",
+    "STOCK_SYMBOLS": "screener.config",
+    "INDEX_SYMBOLS": "screener.config",
+    "set_opstra_cookies": "screener.iv",
+    "is_opstra_configured": "screener.iv",
+    "get_iv_data": "screener.iv",
+    "is_market_hours": "screener.api",
+    "get_india_vix": "screener.api",
+    "determine_market_regime": "screener.api",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 __all__ = [
     # Main functions
     "job",
@@ -1,11 +1,13 @@
 """NSE API integration module."""
 
 from screener.api.nse_session import get_nse_session, NSE_HEADERS
-from screener.api.option_chain import fetch_nse_option_chain
+from screener.api.option_chain import fetch_nse_option_chain, fetch_many_option_chains
 from screener.api.market_status import (
     is_market_hours,
     get_market_status_details,
     get_india_vix,
+    fetch_all_indices,
+    get_index_spot,
     determine_market_regime,
 )
 
@@ -13,9 +15,12 @@ __all__ = [
     "get_nse_session",
     "NSE_HEADERS",
     "fetch_nse_option_chain",
+    "fetch_many_option_chains",
     "is_market_hours",
     "get_market_status_details",
     "get_india_vix",
+    "fetch_all_indices",
+    "get_index_spot",
     "determine_market_regime",
 ]
 
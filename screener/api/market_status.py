@@ -6,16 +6,26 @@ Checks if NSE market is open and fetches VIX data.
 
 import time
 from datetime import datetime
-import requests
 
 from screener.api.nse_session import get_nse_session
-from screener.config import MARKET_START, MARKET_END, IST, NSE_HEADERS
+from screener.config import MARKET_START, MARKET_END, IST, NSE_HEADERS, NSE_INDEX_NAMES
 from screener.utils.logging_setup import logger
 
 # Cache for market status validation
 _market_status_cache = {'status': None, 'timestamp': 0}
 _MARKET_STATUS_CACHE_DURATION = 300  # 5 minutes
 
+# Trading session bounds as seconds since midnight (IST)
+_MARKET_START_S = MARKET_START.hour * 3600 + MARKET_START.minute * 60 + MARKET_START.second
+_MARKET_END_S = MARKET_END.hour * 3600 + MARKET_END.minute * 60 + MARKET_END.second
+
+# is_market_hours() result, reused within one _MARKET_HOURS_BUCKET-second bucket
+_market_hours_cache = {'bucket': None, 'status': None}
+_MARKET_HOURS_BUCKET = 30
+
+# Cache for the allIndices snapshot (VIX and index spots come from one request)
+_all_indices_cache = {'data': None, 'timestamp': 0}
+
 
 def is_market_hours():
     """
@@ -27,8 +37,21 @@ def is_market_hours():
     Returns:
         bool: True if market is open, False otherwise
     """
+    # Called per symbol (option chain cache TTL); reuse the answer within
+    # a 30s bucket instead of re-deriving it each time
+    bucket = int(time.time() // _MARKET_HOURS_BUCKET)
+    if _market_hours_cache['bucket'] == bucket:
+        return _market_hours_cache['status']
+    
+    status = _check_market_hours()
+    _market_hours_cache['bucket'] = bucket
+    _market_hours_cache['status'] = status
+    return status
+
+
+def _check_market_hours():
+    """Weekday, trading-hours and NSE holiday checks behind is_market_hours()."""
     now = datetime.now(IST)
-    current_time = now.time()
     
     # Check 1: Is it a weekday? (Monday=0, Sunday=6)
     if now.weekday() >= 5:  # Saturday or Sunday
@@ -36,8 +59,9 @@ def is_market_hours():
         return False
     
     # Check 2: Is it within trading hours?
-    if not (MARKET_START <= current_time <= MARKET_END):
-        logger.debug("Market closed: Outside trading hours (%s)", current_time.strftime('%H:%M'))
+    seconds = now.hour * 3600 + now.minute * 60 + now.second
+    if not (_MARKET_START_S <= seconds <= _MARKET_END_S):
+        logger.debug("Market closed: Outside trading hours (%s)", now.strftime('%H:%M'))
         return False
     
     # Check 3: Validate with NSE API (checks for holidays)
@@ -133,28 +157,73 @@ def get_market_status_details():
         return {'error': str(e)}
 
 
+def fetch_all_indices(ttl=30):
+    """
+    Fetch last prices of all NSE indices in one allIndices request.
+    
+    Uses the shared NSE session; the snapshot is cached for `ttl` seconds so
+    the VIX and index spot lookups of one scan share a single request.
+    
+    Args:
+        ttl: Seconds a fetched snapshot is reused
+    
+    Returns:
+        dict: NSE index name (e.g. 'NIFTY 50', 'INDIA VIX') -> last price,
+        or an empty dict on failure
+    """
+    global _all_indices_cache
+    
+    current_time = time.time()
+    
+    # Return cached snapshot if still valid
+    if _all_indices_cache['data'] is not None:
+        if current_time - _all_indices_cache['timestamp'] < ttl:
+            return _all_indices_cache['data']
+    
+    try:
+        session = get_nse_session()
+        if session:
+            url = "https://www.nseindia.com/api/allIndices"
+            response = session.get(url, headers=NSE_HEADERS, timeout=10)
+            
+            if response.status_code == 200:
+                data = {
+                    index.get('index'): index.get('last')
+                    for index in response.json().get('data', [])
+                    if index.get('last') is not None
+                }
+                _all_indices_cache = {'data': data, 'timestamp': current_time}
+                return data
+    except Exception as e:
+        logger.debug("Error fetching NSE allIndices: %s", e)
+    
+    return {}
+
+
+def get_index_spot(symbol):
+    """
+    Get an index's last price from the cached allIndices snapshot.
+    
+    Args:
+        symbol: Index symbol (e.g., 'NIFTY', 'BANKNIFTY')
+    
+    Returns:
+        float or None: Last price, or None if unavailable
+    """
+    name = NSE_INDEX_NAMES.get(symbol)
+    if not name:
+        return None
+    return fetch_all_indices().get(name)
+
+
 def get_india_vix():
     """
-    Fetch the current India VIX value.
+    Fetch the current India VIX value (from the cached allIndices snapshot).
     
     Returns:
         float: Current VIX value, or 16.0 as default
     """
-    try:
-        url = "https://www.nseindia.com/api/allIndices"
-        headers = {"User-Agent": "Mozilla/5.0", "Accept": "application/json"}
-        session = requests.Session()
-        session.get("https://www.nseindia.com", headers=headers, timeout=5)
-        response = session.get(url, headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            for index in response.json().get('data', []):
-                if index.get('index') == 'INDIA VIX':
-                    return index.get('last', 16.0)
-    except:
-        pass
-    
-    return 16.0
+    return fetch_all_indices().get('INDIA VIX', 16.0)
 
 
 def determine_market_regime(vix):
@@ -7,29 +7,62 @@ Handles session creation, cookie management, and automatic refresh.
 import time
 import requests
 
-from screener.config import NSE_SESSION_TIMEOUT, NSE_HEADERS
+from screener.config import NSE_SESSION_TIMEOUT, NSE_HEADERS, NSE_HTTP2_MAX_CONNECTIONS
 from screener.utils.logging_setup import logger
 
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Timeout exceptions raised by whichever client get_nse_session() returns
+if HTTPX_AVAILABLE:
+    NSE_TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+else:
+    NSE_TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+
 # Global session for NSE API requests
 _nse_session = None
 _nse_session_time = 0
 
 
+def _new_session():
+    """
+    Create the HTTP client for NSE requests.
+    
+    Uses an HTTP/2 httpx.Client when httpx and h2 are installed, so the
+    parallel option-chain fetches multiplex over one TLS connection;
+    otherwise a requests.Session (HTTP/1.1 keep-alive).
+    """
+    if HTTPX_AVAILABLE:
+        return httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=NSE_HTTP2_MAX_CONNECTIONS),
+        )
+    return requests.Session()
+
+
 def get_nse_session():
     """
     Get or create NSE session with proper cookies.
     
     The session is cached and refreshed every NSE_SESSION_TIMEOUT seconds.
+    Both client types share the get(url, headers=..., timeout=...) call and
+    the status_code/content/json() response API used by callers.
     
     Returns:
-        requests.Session or None: Active session, or None on failure
+        httpx.Client, requests.Session, or None: Active session, or None on failure
     """
     global _nse_session, _nse_session_time
     
     current_time = time.time()
     
     if _nse_session is None or (current_time - _nse_session_time) > NSE_SESSION_TIMEOUT:
-        _nse_session = requests.Session()
+        _nse_session = _new_session()
         try:
             # Visit homepage to get session cookies (use simpler headers for initial request)
             homepage_headers = {
@@ -4,12 +4,136 @@ NSE Option Chain API v3 integration.
 Fetches and normalizes option chain data from NSE.
 """
 
-import requests
+import json
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 
-from screener.api.nse_session import get_nse_session
-from screener.config import NSE_HEADERS
+from screener.api.nse_session import get_nse_session, NSE_TIMEOUT_ERRORS
+from screener.api.market_status import is_market_hours
+from screener.config import (
+    NSE_HEADERS, OPTION_CHAIN_CACHE_TTL_LIVE, OPTION_CHAIN_CACHE_TTL_AFTER_HOURS,
+    EXPIRY_DATES_CACHE_TTL, OPTION_CHAIN_FETCH_WORKERS, OPTION_CHAIN_FETCH_JITTER
+)
 from screener.utils.logging_setup import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Cache of last good option chain per (symbol, is_index) -> (timestamp, result)
+_option_chain_cache = {}
+
+# Cache of contract-info expiry dates per symbol -> (timestamp, expiry_dates)
+_expiry_cache = {}
+
+
+# Per-leg fields copied into the columnar view: column suffix -> normalized key
+_COLUMN_FIELDS = (
+    ('oi', 'openInterest'),
+    ('volume', 'totalTradedVolume'),
+    ('iv', 'impliedVolatility'),
+    ('bid', 'bidPrice'),
+    ('ask', 'askPrice'),
+    ('last', 'lastPrice'),
+)
+
+
+def _parse_json(content):
+    """Parse a response body (bytes) with orjson when available."""
+    return orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+
+
+def _normalize_leg(opt, expiry):
+    """
+    Normalize one CE/PE leg of an NSE v3 chain row.
+    
+    A single straight-line dict literal shared by both legs (the v3 schema is
+    fixed), mapping buyPrice1/sellPrice1 etc. to the bidPrice/askPrice names
+    the scanners and strategies use.
+    """
+    get = opt.get
+    return {
+        'strikePrice': get('strikePrice'),
+        'expiryDate': expiry,
+        'openInterest': get('openInterest', 0),
+        'changeinOpenInterest': get('changeinOpenInterest', 0),
+        'totalTradedVolume': get('totalTradedVolume', 0),
+        'impliedVolatility': get('impliedVolatility', 0),
+        'lastPrice': get('lastPrice', 0),
+        'bidPrice': get('buyPrice1', 0),
+        'askPrice': get('sellPrice1', 0),
+        'bidQty': get('buyQuantity1', 0),
+        'askQty': get('sellQuantity1', 0),
+        'underlyingValue': get('underlyingValue', 0),
+    }
+
+
+def _build_columns(data):
+    """
+    Build a struct-of-arrays view of normalized option chain rows.
+    
+    Row i of every array describes data[i]: 'strike' (0 when missing),
+    'has_ce'/'has_pe' masks, and float64 'ce_oi', 'ce_volume', 'ce_iv',
+    'ce_bid', 'ce_ask', 'ce_last' plus the 'pe_' equivalents (0 for a
+    missing leg or value).
+    """
+    n = len(data)
+    columns = {'strike': np.zeros(n)}
+    legs = (('ce', 'CE'), ('pe', 'PE'))
+    for prefix, _ in legs:
+        columns[f'has_{prefix}'] = np.zeros(n, dtype=bool)
+        for suffix, _ in _COLUMN_FIELDS:
+            columns[f'{prefix}_{suffix}'] = np.zeros(n)
+    
+    for i, item in enumerate(data):
+        columns['strike'][i] = item.get('strikePrice') or 0
+        for prefix, key in legs:
+            opt = item.get(key)
+            if opt is None:
+                continue
+            columns[f'has_{prefix}'][i] = True
+            for suffix, field in _COLUMN_FIELDS:
+                columns[f'{prefix}_{suffix}'][i] = opt.get(field) or 0
+    
+    return columns
+
+
+def _get_expiry_dates(session, symbol, current_time):
+    """
+    Get the expiry dates for a symbol from the contract-info API.
+    
+    Results are cached for EXPIRY_DATES_CACHE_TTL seconds; the option chain
+    fetch drops the entry when the chain endpoint rejects the cached expiry.
+    
+    Returns:
+        list: Expiry date strings (nearest first), or None on failure
+    """
+    if symbol in _expiry_cache:
+        cached_time, expiry_dates = _expiry_cache[symbol]
+        if current_time - cached_time < EXPIRY_DATES_CACHE_TTL:
+            return expiry_dates
+    
+    contract_url = f"https://www.nseindia.com/api/option-chain-contract-info?symbol={symbol}"
+    resp = session.get(contract_url, headers=NSE_HEADERS, timeout=15)
+    
+    if resp.status_code != 200:
+        logger.debug("Contract info failed for %s: HTTP %d", symbol, resp.status_code)
+        return None
+    
+    contract_data = _parse_json(resp.content)
+    expiry_dates = contract_data.get('expiryDates', [])
+    
+    if not expiry_dates:
+        logger.debug("No expiry dates found for %s", symbol)
+        return None
+    
+    _expiry_cache[symbol] = (current_time, expiry_dates)
+    return expiry_dates
+
 
 def fetch_nse_option_chain(symbol, is_index=False):
     """
@@ -19,27 +143,33 @@ def fetch_nse_option_chain(symbol, is_index=False):
         symbol: Stock/Index symbol (e.g., 'NIFTY', 'RELIANCE')
         is_index: True for indices (NIFTY, BANKNIFTY), False for stocks
     
+    Successful results are cached for OPTION_CHAIN_CACHE_TTL_LIVE seconds
+    during market hours (OPTION_CHAIN_CACHE_TTL_AFTER_HOURS otherwise), so
+    the returned dict is shared and must be treated as read-only.
+    
     Returns:
-        dict with 'records' key containing option chain data, or None on failure
+        dict with 'records' key containing option chain data, or None on failure.
+        records['data'] holds the per-strike dicts; records['columns'] holds
+        the same rows as NumPy arrays (see _build_columns) for vectorized filters.
     """
+    cache_key = (symbol, is_index)
+    current_time = time.time()
+    
+    # Return cached chain if still valid
+    if cache_key in _option_chain_cache:
+        cached_time, cached_result = _option_chain_cache[cache_key]
+        ttl = OPTION_CHAIN_CACHE_TTL_LIVE if is_market_hours() else OPTION_CHAIN_CACHE_TTL_AFTER_HOURS
+        if current_time - cached_time < ttl:
+            return cached_result
+    
     session = get_nse_session()
     if not session:
         return None
     
     try:
-        # First get available expiry dates
-        contract_url = f"https://www.nseindia.com/api/option-chain-contract-info?symbol={symbol}"
-        resp = session.get(contract_url, headers=NSE_HEADERS, timeout=15)
-        
-        if resp.status_code != 200:
-            logger.debug("Contract info failed for %s: HTTP %d", symbol, resp.status_code)
-            return None
-        
-        contract_data = resp.json()
-        expiry_dates = contract_data.get('expiryDates', [])
-        
+        # Available expiry dates (cached; they only change after an expiry)
+        expiry_dates = _get_expiry_dates(session, symbol, current_time)
         if not expiry_dates:
-            logger.debug("No expiry dates found for %s", symbol)
             return None
         
         # Use nearest expiry
@@ -53,12 +183,16 @@ def fetch_nse_option_chain(symbol, is_index=False):
         
         if resp.status_code != 200:
             logger.debug("Option chain failed for %s: HTTP %d", symbol, resp.status_code)
+            if 400 <= resp.status_code < 500:
+                # Cached nearest expiry has probably rolled over
+                _expiry_cache.pop(symbol, None)
             return None
         
-        data = resp.json()
+        data = _parse_json(resp.content)
         
         if 'records' not in data:
             logger.debug("No records in option chain for %s", symbol)
+            _expiry_cache.pop(symbol, None)
             return None
         
         records = data['records']
@@ -68,65 +202,80 @@ def fetch_nse_option_chain(symbol, is_index=False):
         
         # Normalize field names for compatibility with existing code
         # The new API uses buyPrice1/sellPrice1 instead of bidPrice/askPrice
-        normalized_data = []
-        for item in records.get('data', []):
+        items = records.get('data', [])
+        normalized_data = [None] * len(items)
+        for i, item in enumerate(items):
             normalized_item = {
                 'strikePrice': item.get('strikePrice'),
                 'expiryDate': nearest_expiry
             }
-            
-            # Normalize CE data
             if 'CE' in item:
-                ce = item['CE']
-                normalized_item['CE'] = {
-                    'strikePrice': ce.get('strikePrice'),
-                    'expiryDate': nearest_expiry,
-                    'openInterest': ce.get('openInterest', 0),
-                    'changeinOpenInterest': ce.get('changeinOpenInterest', 0),
-                    'totalTradedVolume': ce.get('totalTradedVolume', 0),
-                    'impliedVolatility': ce.get('impliedVolatility', 0),
-                    'lastPrice': ce.get('lastPrice', 0),
-                    'bidPrice': ce.get('buyPrice1', 0),  # Normalize field name
-                    'askPrice': ce.get('sellPrice1', 0),  # Normalize field name
-                    'bidQty': ce.get('buyQuantity1', 0),
-                    'askQty': ce.get('sellQuantity1', 0),
-                    'underlyingValue': ce.get('underlyingValue', 0),
-                }
-            
-            # Normalize PE data
+                normalized_item['CE'] = _normalize_leg(item['CE'], nearest_expiry)
             if 'PE' in item:
-                pe = item['PE']
-                normalized_item['PE'] = {
-                    'strikePrice': pe.get('strikePrice'),
-                    'expiryDate': nearest_expiry,
-                    'openInterest': pe.get('openInterest', 0),
-                    'changeinOpenInterest': pe.get('changeinOpenInterest', 0),
-                    'totalTradedVolume': pe.get('totalTradedVolume', 0),
-                    'impliedVolatility': pe.get('impliedVolatility', 0),
-                    'lastPrice': pe.get('lastPrice', 0),
-                    'bidPrice': pe.get('buyPrice1', 0),  # Normalize field name
-                    'askPrice': pe.get('sellPrice1', 0),  # Normalize field name
-                    'bidQty': pe.get('buyQuantity1', 0),
-                    'askQty': pe.get('sellQuantity1', 0),
-                    'underlyingValue': pe.get('underlyingValue', 0),
-                }
+                normalized_item['PE'] = _normalize_leg(item['PE'], nearest_expiry)
             
-            normalized_data.append(normalized_item)
+            normalized_data[i] = normalized_item
         
         # Return in format compatible with existing code
-        return {
+        result = {
             'records': {
                 'data': normalized_data,
+                'columns': _build_columns(normalized_data),
                 'expiryDates': expiry_dates,
                 'underlyingValue': records.get('underlyingValue', 0),
                 'timestamp': records.get('timestamp', '')
             }
         }
+        _option_chain_cache[cache_key] = (current_time, result)
+        return result
     
-    except requests.exceptions.Timeout:
+    except NSE_TIMEOUT_ERRORS:
         logger.debug("NSE API timeout for %s", symbol)
         return None
     except Exception as e:
         logger.debug("NSE API error for %s: %s", symbol, e)
         return None
 
+
+def _fetch_with_jitter(symbol, is_index):
+    """Fetch one option chain after a small random delay (spreads out NSE requests)."""
+    time.sleep(random.uniform(0, OPTION_CHAIN_FETCH_JITTER))
+    return fetch_nse_option_chain(symbol, is_index)
+
+
+def fetch_many_option_chains(symbols):
+    """
+    Fetch option chains for several symbols in parallel.
+    
+    Uses a bounded thread pool (OPTION_CHAIN_FETCH_WORKERS) sharing the NSE
+    session; each fetch is delayed by a small random jitter so requests
+    don't hit NSE in lockstep.
+    
+    Args:
+        symbols: List of (symbol, is_index) tuples
+    
+    Returns:
+        dict: symbol -> option chain dict (as fetch_nse_option_chain), or None on failure
+    """
+    results = {}
+    if not symbols:
+        return results
+    
+    # Create the shared session once, before the workers race to do it
+    if not get_nse_session():
+        return {symbol: None for symbol, _ in symbols}
+    
+    with ThreadPoolExecutor(max_workers=OPTION_CHAIN_FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(_fetch_with_jitter, symbol, is_index): symbol
+            for symbol, is_index in symbols
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                results[symbol] = future.result()
+            except Exception as e:
+                logger.debug("Parallel option chain fetch failed for %s: %s", symbol, e)
+                results[symbol] = None
+    
+    return results
@@ -4,17 +4,27 @@ Configuration constants for the Smart Options Screener.
 Contains all thresholds, stock lists, lot sizes, and other settings.
 """
 
+import os
 import pytz
 from datetime import time as dtime
 
+# Secrets and per-machine settings come from the environment; a .env file in
+# the working directory is loaded when python-dotenv is installed
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
 # ================== TELEGRAM CONFIGURATION ==================
-TELEGRAM_BOT_TOKEN = "8554491299:AAEYVxPF-THCg5f37JsDBHGUI3kTON2idPM"
-TELEGRAM_CHAT_ID = "@manish_private_bot"
+TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
+TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", "@manish_private_bot")
 
 # ================== SYMBOL LISTS ==================
 INDEX_SYMBOLS = ["NIFTY", "BANKNIFTY"]
 
-STOCK_SYMBOLS = list(set([
+# Deduplicated in listed order, so scan order is the same on every run
+STOCK_SYMBOLS = tuple(dict.fromkeys([
     "HDFCBANK", "ICICIBANK", "AXISBANK", "KOTAKBANK", "SBIN",
     "RELIANCE", "TCS", "INFY", "HCLTECH", "WIPRO", "TECHM", "LTIM",
     "MARUTI", "M&M", "LT", "TATAMOTORS",
@@ -36,9 +46,10 @@ STOCK_SYMBOLS = list(set([
 ]))
 
 # Symbol mapping for yfinance
-SYMBOL_MAP = {"NIFTY": "^NSEI", "BANKNIFTY": "^NSEBANK"}
-for stock in STOCK_SYMBOLS:
-    SYMBOL_MAP[stock] = f"{stock}.NS"
+SYMBOL_MAP = {
+    "NIFTY": "^NSEI", "BANKNIFTY": "^NSEBANK",
+    **{stock: f"{stock}.NS" for stock in STOCK_SYMBOLS},
+}
 
 # ================== OPSTRA CONFIGURATION ==================
 # Auto-login uses a persistent Chrome profile to avoid daily manual cookie refresh.
@@ -49,14 +60,13 @@ for stock in STOCK_SYMBOLS:
 
 # Path to persistent Chrome profile for Opstra auto-login
 # Set to None to use default (~/.opstra_chrome_profile)
-CHROME_PROFILE_PATH = None
+CHROME_PROFILE_PATH = os.environ.get('OPSTRA_CHROME_PROFILE') or None
 
-# Cookies are auto-populated by opstra_login.py, but can be set manually here
+# Cookies are auto-populated by opstra_login.py, but can be set manually via
+# the OPSTRA_JSESSIONID / OPSTRA_DSESSIONID environment variables
 OPSTRA_COOKIES = {
-    'JSESSIONID': '04EB3B224EF6C27972375140B9D2A554',
-    'DSESSIONID': '243CB610EA5FEEE81D924097B818311C',
-    '_ga': 'GA1.1.513355576.1767094859',
-    '_ga_6D0ZQ437SD': 'GS2.1.s1767094858$o1$g1$t1767094864$j54$l0$h0'
+    'JSESSIONID': os.environ.get('OPSTRA_JSESSIONID', ''),
+    'DSESSIONID': os.environ.get('OPSTRA_DSESSIONID', ''),
 }
 
 # Set to True to require Opstra (will skip stocks without IV data)
@@ -67,6 +77,13 @@ REQUIRE_OPSTRA_IV = True
 IV_CACHE = {}
 IV_CACHE_DURATION = 300  # 5 minutes
 
+# Disk cache of IV/HV results (SQLite), reused across runs on the same day
+IV_DISK_CACHE_FILE = os.environ.get(
+    'SCREENER_IV_CACHE', os.path.join(os.path.expanduser('~'), '.iv_cache.db')
+)
+IV_DISK_CACHE_DURATION = 1800  # 30 minutes
+IV_FETCH_WORKERS = 10  # Parallel IV lookups (Opstra requests / HV downloads) per scan
+
 # ================== LOT SIZES ==================
 LOT_SIZES = {
     "NIFTY": 25, "BANKNIFTY": 15, "FINNIFTY": 25, "MIDCPNIFTY": 50,
@@ -164,12 +181,27 @@ MARKET_START = dtime(9, 15)
 MARKET_END = dtime(15, 30)
 IST = pytz.timezone("Asia/Kolkata")
 
+# Index names as reported by NSE's allIndices API
+NSE_INDEX_NAMES = {"NIFTY": "NIFTY 50", "BANKNIFTY": "NIFTY BANK"}
+
 # ================== OUTPUT FILES ==================
-CSV_FILE = "/Users/manishkumarsingh/Documents/option_testing_qwen/new_screener_options_scan_log_v3_3.csv"
-JSON_FILE = "/Users/manishkumarsingh/Documents/option_testing_qwen/new_screener_alerts_v3_3.json"
+# Defaults to the project root (the directory containing the screener package)
+SCREENER_DATA_DIR = os.environ.get(
+    'SCREENER_DATA_DIR', os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+CSV_FILE = os.path.join(SCREENER_DATA_DIR, "new_screener_options_scan_log_v3_3.csv")
+JSON_FILE = os.path.join(SCREENER_DATA_DIR, "new_screener_alerts_v3_3.json")
 
 # ================== NSE API CONFIGURATION ==================
 NSE_SESSION_TIMEOUT = 300  # Refresh session every 5 minutes
+NSE_HTTP2_MAX_CONNECTIONS = 10  # Keep-alive pool size for the HTTP/2 client (httpx + h2)
+OPTION_CHAIN_CACHE_TTL_LIVE = 30          # Reuse a fetched option chain for 30s during market hours
+OPTION_CHAIN_CACHE_TTL_AFTER_HOURS = 300  # Chains don't change after the close
+EXPIRY_DATES_CACHE_TTL = 6 * 3600         # Expiry list only changes after each expiry
+OPTION_CHAIN_FETCH_WORKERS = int(os.environ.get('SCREENER_FETCH_WORKERS', 5))  # Parallel option-chain fetches (keep low to avoid NSE throttling)
+OPTION_CHAIN_FETCH_JITTER = 0.3           # Max random delay (s) before each parallel fetch
+SCAN_WORKERS = 8                          # Symbols scanned concurrently (per-symbol downloads overlap)
+SCAN_MIN_INTERVAL = 0.3                   # Min seconds between symbol scan starts (overall request pacing)
 
 NSE_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -1,19 +1,24 @@
 """IV (Implied Volatility) data providers."""
 
-from screener.iv.provider import get_iv_data, set_skip_opstra, is_skip_opstra_enabled
+from screener.iv.provider import get_iv_data, get_iv_data_batch, set_skip_opstra, is_skip_opstra_enabled
 from screener.iv.opstra import get_iv_from_opstra, set_opstra_cookies, is_opstra_configured, validate_opstra_session
-from screener.iv.historical import calculate_historical_volatility
+from screener.iv.opstra_async import get_iv_batch, get_iv_batch_async
+from screener.iv.historical import calculate_historical_volatility, calculate_historical_volatility_batch
 from screener.iv.opstra_login import refresh_opstra_session, clear_opstra_profile
 
 __all__ = [
     "get_iv_data",
+    "get_iv_data_batch",
     "set_skip_opstra",
     "is_skip_opstra_enabled",
     "get_iv_from_opstra",
     "set_opstra_cookies",
     "is_opstra_configured",
     "validate_opstra_session",
+    "get_iv_batch",
+    "get_iv_batch_async",
     "calculate_historical_volatility",
+    "calculate_historical_volatility_batch",
     "refresh_opstra_session",
     "clear_opstra_profile",
 ]
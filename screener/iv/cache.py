@@ -0,0 +1,87 @@
+"""
+Disk-backed cache for IV data.
+
+Stores Opstra IV and calculated HV results in a small SQLite database so a
+fresh process (or a rerun later the same day) can skip the Opstra request
+or yfinance download for symbols it already has.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from screener.config import IST, IV_DISK_CACHE_FILE, IV_DISK_CACHE_DURATION
+from screener.utils.logging_setup import logger
+
+# Rows older than this are pruned when the database is opened
+_PRUNE_AGE = 7 * 24 * 3600
+
+# One shared connection; scans call the IV providers from several threads
+_conn = None
+_lock = threading.Lock()
+
+
+def _get_connection():
+    """Open (once) the cache database, creating the table if needed."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(IV_DISK_CACHE_FILE, check_same_thread=False)
+        conn.execute("CREATE TABLE IF NOT EXISTS iv (key TEXT PRIMARY KEY, ts REAL, payload TEXT)")
+        conn.execute("DELETE FROM iv WHERE ts < ?", (time.time() - _PRUNE_AGE,))
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def make_cache_key(source, symbol, *params):
+    """
+    Build the cache key for one result.
+
+    Keys include today's IST date, so cached values never carry over into
+    the next trading day.
+
+    Args:
+        source: Data source tag ('opstra', 'hv')
+        symbol: Stock or index symbol
+        *params: Extra parameters the result depends on (e.g. HV period, window)
+    """
+    date = datetime.now(IST).strftime('%Y-%m-%d')
+    return ":".join([source, symbol.upper(), date, *map(str, params)])
+
+
+def get_cached_iv(key, max_age=IV_DISK_CACHE_DURATION):
+    """
+    Look up a cached result.
+
+    Returns:
+        dict or None: Cached result if present and younger than max_age seconds
+    """
+    try:
+        with _lock:
+            row = _get_connection().execute(
+                "SELECT ts, payload FROM iv WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.debug("IV disk cache read failed for %s: %s", key, e)
+        return None
+
+    if row is None or time.time() - row[0] >= max_age:
+        return None
+    return json.loads(row[1])
+
+
+def set_cached_iv(key, result):
+    """Store a result (a JSON-serializable dict) under key."""
+    try:
+        payload = json.dumps(result)
+        with _lock:
+            conn = _get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO iv (key, ts, payload) VALUES (?, ?, ?)",
+                (key, time.time(), payload)
+            )
+            conn.commit()
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        logger.debug("IV disk cache write failed for %s: %s", key, e)
@@ -4,12 +4,29 @@ Historical Volatility calculation.
 Calculates HV from price data as a fallback when IV is unavailable.
 """
 
+import functools
+import time
+
 import numpy as np
 import yfinance as yf
 
-from screener.config import SYMBOL_MAP
+from screener.config import SYMBOL_MAP, IV_DISK_CACHE_DURATION
+from screener.iv.cache import make_cache_key, get_cached_iv, set_cached_iv
+from screener.iv.stats import percentile_and_rank
 from screener.utils.logging_setup import logger
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
 
 # ================== CONFIGURABLE HV PARAMETERS ==================
 # These can be overridden at runtime via set_hv_params()
@@ -37,6 +54,185 @@ def get_hv_params():
     return _HV_PARAMS.copy()
 
 
+def _get_params(period=None, window=None):
+    """Resolve HV (period, window), filling unset values from _HV_PARAMS."""
+    return (
+        _HV_PARAMS['period'] if period is None else period,
+        _HV_PARAMS['window'] if window is None else window,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_ticker(symbol):
+    """Yahoo Finance ticker for symbol (NSE equities get the .NS suffix)."""
+    return SYMBOL_MAP.get(symbol, f"{symbol}.NS")
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: closes can contain NaN (missing bars), which fastmath
+    # assumes away. Explicit signature compiles at import (cached on disk).
+    @njit("UniTuple(float64, 5)(float64[:], int64)", cache=True)
+    def _hv_stats(closes, window):
+        """
+        Rolling annualized HV (%) of daily log returns, reduced to the
+        figures the HV percentile and rank need.
+        
+        Windows containing NaN are skipped.
+        
+        Returns:
+            tuple: (current_hv, count of values <= current_hv, min, max,
+            number of valid values); current_hv is NaN if none are valid
+        """
+        n_ret = closes.shape[0] - 1
+        n_out = max(n_ret - window + 1, 0)
+        
+        # Pass 1: log returns, and their mean to centre the running sums
+        returns = np.empty(max(n_ret, 0))
+        total = 0.0
+        n_finite = 0
+        for i in range(n_ret):
+            r = np.log(closes[i + 1] / closes[i])
+            returns[i] = r
+            if not np.isnan(r):
+                total += r
+                n_finite += 1
+        shift = total / n_finite if n_finite > 0 else 0.0
+        
+        # Pass 2: slide the window, adding the new return and dropping the
+        # oldest; var = (S2 - S*S/w) / (w - 1)
+        hv = np.empty(n_out)
+        scale = np.sqrt(252.0) * 100.0
+        s = 0.0
+        s2 = 0.0
+        n_nan = 0
+        for i in range(n_ret):
+            r = returns[i]
+            if np.isnan(r):
+                n_nan += 1
+            else:
+                d = r - shift
+                s += d
+                s2 += d * d
+            if i >= window:
+                r = returns[i - window]
+                if np.isnan(r):
+                    n_nan -= 1
+                else:
+                    d = r - shift
+                    s -= d
+                    s2 -= d * d
+            if i >= window - 1:
+                if n_nan > 0:
+                    hv[i - window + 1] = np.nan
+                else:
+                    var = (s2 - s * s / window) / (window - 1)
+                    hv[i - window + 1] = np.sqrt(max(var, 0.0)) * scale
+        
+        # Pass 3: latest valid value, min, max, then the percentile count
+        current = np.nan
+        hv_min = np.inf
+        hv_max = -np.inf
+        n_valid = 0
+        for j in range(n_out):
+            v = hv[j]
+            if not np.isnan(v):
+                current = v
+                n_valid += 1
+                hv_min = min(hv_min, v)
+                hv_max = max(hv_max, v)
+        n_le = 0
+        for j in range(n_out):
+            if hv[j] <= current:
+                n_le += 1
+        return current, float(n_le), hv_min, hv_max, float(n_valid)
+else:
+    def _hv_series(closes, window):
+        """
+        Rolling annualized HV (%) of daily log returns.
+        
+        Returns one value per full window (len(closes) - window values);
+        a window containing NaN yields NaN.
+        """
+        returns = np.log(closes[1:] / closes[:-1])
+        if returns.shape[0] < window:
+            return np.empty(0)
+        
+        if BOTTLENECK_AVAILABLE:
+            # C moving-window std; NaN for windows containing NaN, as below
+            return bn.move_std(returns, window, ddof=1)[window - 1:] * np.sqrt(252) * 100
+        
+        # Window sums from cumulative sums: var = (S2 - S*S/w) / (w - 1).
+        # Returns are centred first to keep S2 - S*S/w well conditioned;
+        # NaNs count as 0 in the sums and mark their windows separately.
+        nan = np.isnan(returns)
+        centred = np.where(nan, 0.0, returns - np.nanmean(returns))
+        cs = np.concatenate(([0.0], np.cumsum(centred)))
+        cs2 = np.concatenate(([0.0], np.cumsum(centred * centred)))
+        cnan = np.concatenate(([0], np.cumsum(nan)))
+        
+        s = cs[window:] - cs[:-window]
+        s2 = cs2[window:] - cs2[:-window]
+        var = np.maximum((s2 - s * s / window) / (window - 1), 0.0)
+        hv = np.sqrt(var) * np.sqrt(252) * 100
+        hv[(cnan[window:] - cnan[:-window]) > 0] = np.nan
+        return hv
+    
+    def _hv_stats(closes, window):
+        """
+        Rolling annualized HV (%) of daily log returns, reduced to the
+        figures the HV percentile and rank need.
+        
+        Windows containing NaN are skipped.
+        
+        Returns:
+            tuple: (current_hv, count of values <= current_hv, min, max,
+            number of valid values); current_hv is NaN if none are valid
+        """
+        hv_values = _hv_series(closes, window)
+        hv_values = hv_values[~np.isnan(hv_values)]
+        if len(hv_values) == 0:
+            return np.nan, 0.0, np.inf, -np.inf, 0.0
+        
+        current_hv = hv_values[-1]
+        
+        # One sort gives the percentile position, min and max
+        sorted_hv = np.sort(hv_values)
+        n_le = np.searchsorted(sorted_hv, current_hv, side='right')
+        return current_hv, float(n_le), sorted_hv[0], sorted_hv[-1], float(len(sorted_hv))
+
+
+def _hv_from_closes(closes, window):
+    """
+    Build the HV result dict from daily closes.
+    
+    Returns:
+        dict or None: As calculate_historical_volatility, or None if there
+        is not enough history
+    """
+    if len(closes) < 60:  # Need at least 60 days
+        return None
+    
+    # Rolling HV (annualized) of daily log returns using configured window.
+    # np.array copies: pandas can hand out read-only views, which the
+    # compiled kernel's signature does not accept
+    current_hv, n_le, hv_min, hv_max, n_valid = _hv_stats(
+        np.array(closes, dtype=np.float64), int(window)
+    )
+    
+    if n_valid < 30:
+        return None
+    
+    # HV percentile and rank (same definitions as IV percentile/rank)
+    hv_percentile, hv_rank = percentile_and_rank(current_hv, n_le, hv_min, hv_max, n_valid)
+    
+    return {
+        'iv': float(current_hv),  # Note: This is HV, not IV
+        'iv_percentile': int(hv_percentile),
+        'iv_rank': int(hv_rank),
+        'source': 'hv_calculated'  # Clearly mark as calculated, not true IV
+    }
+
+
 def calculate_historical_volatility(symbol, period=None, window=None):
     """
     Calculate Historical Volatility (HV) from price data as a fallback.
@@ -52,53 +248,96 @@ def calculate_historical_volatility(symbol, period=None, window=None):
         dict: {'iv': float, 'iv_percentile': int, 'iv_rank': int, 'source': 'hv_calculated'} or None
     """
     # Use configurable params if not specified
-    if period is None:
-        period = _HV_PARAMS['period']
-    if window is None:
-        window = _HV_PARAMS['window']
+    period, window = _get_params(period, window)
     
     try:
-        ticker = SYMBOL_MAP.get(symbol, f"{symbol}.NS")
-        
-        # Fetch historical data based on configured period
-        hist = yf.Ticker(ticker).history(period=period, interval="1d")
-        
-        if len(hist) < 60:  # Need at least 60 days
-            return None
-        
-        # Calculate daily returns
-        hist['returns'] = np.log(hist['Close'] / hist['Close'].shift(1))
-        
-        # Calculate rolling HV (annualized) using configured window
-        hist['hv'] = hist['returns'].rolling(window=window).std() * np.sqrt(252) * 100
-        
-        # Drop NaN values
-        hv_values = hist['hv'].dropna().values
-        
-        if len(hv_values) < 30:
-            return None
-        
-        current_hv = hv_values[-1]
-        
-        # Calculate HV percentile (similar to IV percentile)
-        hv_percentile = int((np.sum(hv_values <= current_hv) / len(hv_values)) * 100)
-        
-        # Calculate HV rank
-        hv_min = np.min(hv_values)
-        hv_max = np.max(hv_values)
-        if hv_max == hv_min:
-            hv_rank = 50
-        else:
-            hv_rank = int(((current_hv - hv_min) / (hv_max - hv_min)) * 100)
-        
-        return {
-            'iv': current_hv,  # Note: This is HV, not IV
-            'iv_percentile': hv_percentile,
-            'iv_rank': hv_rank,
-            'source': 'hv_calculated'  # Clearly mark as calculated, not true IV
-        }
-    
+        # Memoized per IV_DISK_CACHE_DURATION slot, so it expires with the disk cache
+        return _calc_hv_cached(symbol, period, window, int(time.time() // IV_DISK_CACHE_DURATION))
     except Exception as e:
         logger.debug("HV calculation error for %s: %s", symbol, e)
         return None
 
+
+@functools.lru_cache(maxsize=2048)
+def _calc_hv_cached(symbol, period, window, slot):
+    """
+    Disk cache lookup, else download and compute, for one symbol.
+    
+    slot (the current IV_DISK_CACHE_DURATION time slot) is only part of the
+    memo key. Only successes are memoized: failures raise, including an
+    empty or short download (yfinance returns an empty frame rather than
+    raising), so the next call retries.
+    """
+    disk_key = make_cache_key('hv', symbol, period, window)
+    cached = get_cached_iv(disk_key)
+    if cached:
+        return cached
+    
+    ticker = _resolve_ticker(symbol)
+    
+    # Fetch historical data based on configured period
+    hist = yf.Ticker(ticker).history(period=period, interval="1d")
+    
+    result = _hv_from_closes(hist['Close'].to_numpy(), window)
+    if result is None:
+        raise ValueError(f"not enough price history ({len(hist)} rows)")
+    set_cached_iv(disk_key, result)
+    return result
+
+
+def calculate_historical_volatility_batch(symbols, period=None, window=None):
+    """
+    Calculate HV for several symbols from one batched yfinance download.
+    
+    Symbols found in the disk cache are not downloaded again.
+    
+    Args:
+        symbols: List of stock or index symbols
+        period: Lookback period for data (default: use _HV_PARAMS['period'])
+        window: Rolling window in days (default: use _HV_PARAMS['window'])
+    
+    Returns:
+        dict: symbol -> HV dict (as calculate_historical_volatility) or None.
+        Symbols missing from the download are left out, so callers can fall
+        back to calculate_historical_volatility for them.
+    """
+    period, window = _get_params(period, window)
+    
+    results = {}
+    pending = {}  # Yahoo ticker -> (symbol, disk cache key)
+    for symbol in symbols:
+        disk_key = make_cache_key('hv', symbol, period, window)
+        cached = get_cached_iv(disk_key)
+        if cached:
+            results[symbol] = cached
+        else:
+            pending[_resolve_ticker(symbol)] = (symbol, disk_key)
+    
+    if not pending:
+        return results
+    
+    try:
+        data = yf.download(list(pending), period=period, interval="1d", group_by='ticker',
+                           auto_adjust=True, threads=True, progress=False)
+    except Exception as e:
+        logger.debug("HV batch download error: %s", e)
+        return results
+    
+    for ticker, (symbol, disk_key) in pending.items():
+        try:
+            closes = data[ticker]['Close'].dropna()
+        except KeyError:
+            continue
+        if closes.empty:
+            continue
+        
+        try:
+            result = _hv_from_closes(closes.to_numpy(), window)
+        except Exception as e:
+            logger.debug("HV calculation error for %s: %s", symbol, e)
+            result = None
+        if result:
+            set_cached_iv(disk_key, result)
+        results[symbol] = result
+    
+    return results
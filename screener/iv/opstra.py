@@ -4,13 +4,75 @@ Opstra IV data provider.
 Fetches Implied Volatility data from Opstra API.
 """
 
+import json
 import time
+import threading
 import requests
 import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from screener.config import OPSTRA_COOKIES, IV_CACHE, IV_CACHE_DURATION
+from screener.config import OPSTRA_COOKIES, IV_CACHE, IV_CACHE_DURATION, IV_FETCH_WORKERS
+from screener.iv.cache import make_cache_key, get_cached_iv, set_cached_iv
+from screener.iv.stats import compute_iv_stats
 from screener.utils.logging_setup import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# IV_CACHE is shared by the parallel IV lookups (see get_iv_data_batch)
+_iv_cache_lock = threading.Lock()
+
+OPSTRA_HEADERS = {
+    "accept": "application/json, text/plain, */*",
+    "accept-encoding": "gzip, deflate, br, zstd",
+    "accept-language": "en-GB,en-US;q=0.9,en;q=0.8",
+    "referer": "https://opstra.definedge.com/ivchart",
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+
+def _new_session():
+    """
+    Create the shared Opstra session.
+    
+    Keep-alive connections are pooled (one per IV fetch worker) so each
+    symbol's request skips the TCP/TLS handshake; connection errors are
+    retried twice with a short backoff.
+    """
+    session = requests.Session()
+    session.headers.update(OPSTRA_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=IV_FETCH_WORKERS,
+        pool_maxsize=IV_FETCH_WORKERS,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_opstra_session = _new_session()
+
+# When validate_opstra_session() last succeeded; reused for
+# _SESSION_VALID_DURATION seconds unless the cookies change or a 401 comes back
+_session_valid_time = 0
+_SESSION_VALID_DURATION = 300  # 5 minutes
+
+OPSTRA_IVCHART_URL = "https://opstra.definedge.com/api/ivcharts/{symbol}"
+
+
+def _parse_json(content):
+    """Parse a response body (bytes) with orjson when available."""
+    return orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
 
 
 def set_opstra_cookies(jsessionid, dsessionid):
@@ -20,8 +82,12 @@ def set_opstra_cookies(jsessionid, dsessionid):
     Usage:
         set_opstra_cookies('ABC123...', 'XYZ789...')
     """
+    global _session_valid_time
     OPSTRA_COOKIES['JSESSIONID'] = jsessionid
     OPSTRA_COOKIES['DSESSIONID'] = dsessionid
+    _session_valid_time = 0
+    # Drop cookies the old session picked up (sent with every request otherwise)
+    _opstra_session.cookies.clear()
     logger.info("Opstra cookies updated successfully")
 
 
@@ -34,35 +100,35 @@ def validate_opstra_session():
     """
     Validate if current Opstra cookies are still working.
     
-    Makes a test API call to check session validity.
+    Makes a test API call to check session validity; a successful check is
+    reused for 5 minutes (reset when cookies are set or Opstra returns 401).
     
     Returns:
         bool: True if session is valid, False otherwise
     """
+    global _session_valid_time
+    
     if not is_opstra_configured():
         return False
     
-    headers = {
-        "accept": "application/json, text/plain, */*",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-GB,en-US;q=0.9,en;q=0.8",
-        "referer": "https://opstra.definedge.com/ivchart",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
+    # Validated recently with the same cookies
+    if time.time() - _session_valid_time < _SESSION_VALID_DURATION:
+        return True
     
     try:
         # Test with NIFTY - always available
-        url = "https://opstra.definedge.com/api/ivcharts/NIFTY"
-        response = requests.get(url, headers=headers, cookies=OPSTRA_COOKIES, timeout=10)
+        url = OPSTRA_IVCHART_URL.format(symbol="NIFTY")
+        response = _opstra_session.get(url, cookies=OPSTRA_COOKIES, timeout=10)
         
         if response.status_code == 401:
             logger.debug("Opstra session expired (401)")
             return False
         
         if response.status_code == 200:
-            data = response.json()
+            data = _parse_json(response.content)
             if data.get("ivchart"):
                 logger.debug("Opstra session validated successfully")
+                _session_valid_time = time.time()
                 return True
         
         return False
@@ -72,6 +138,117 @@ def validate_opstra_session():
         return False
 
 
+def get_cached_opstra_iv(symbol):
+    """
+    Look up a symbol's Opstra IV in IV_CACHE, then the disk cache.
+    
+    Returns:
+        dict or None: Cached result (as get_iv_from_opstra)
+    """
+    cache_key = symbol.upper()
+    with _iv_cache_lock:
+        cached = IV_CACHE.get(cache_key)
+    if cached and time.time() - cached['timestamp'] < IV_CACHE_DURATION:
+        return cached['data']
+    
+    # Then the disk cache (survives restarts)
+    disk_cached = get_cached_iv(make_cache_key('opstra', symbol))
+    if disk_cached:
+        with _iv_cache_lock:
+            IV_CACHE[cache_key] = {'data': disk_cached, 'timestamp': time.time()}
+        return disk_cached
+    return None
+
+
+def _read_iv_values(response, stream=False):
+    """
+    ImpVol values of an ivchart response as a float64 array (nulls as 0).
+    
+    With stream=True (a requests response fetched with stream=True, ijson
+    installed) only the ImpVol fields are parsed out of the raw stream;
+    otherwise the whole body is decoded.
+    """
+    if stream:
+        response.raw.decode_content = True  # Undo gzip etc.
+        values = ijson.items(response.raw, 'ivchart.item.ImpVol', use_float=True)
+        return np.fromiter((v or 0.0 for v in values), dtype=np.float64)
+    
+    ivchart = _parse_json(response.content).get("ivchart", [])
+    return np.fromiter(
+        (point.get("ImpVol") or 0.0 for point in ivchart), dtype=np.float64, count=len(ivchart)
+    )
+
+
+def extract_iv_window(symbol, response, stream=False):
+    """
+    Pull the last year of IV values out of an ivchart response.
+    
+    Works with requests and httpx responses (status_code/content); see
+    _read_iv_values for stream.
+    
+    Returns:
+        np.ndarray or None: Up to 252 daily IVs (oldest first), or None if
+        the request failed or there is too little history
+    """
+    global _session_valid_time
+    
+    if response.status_code == 401:
+        logger.warning("Opstra session expired (401). Please refresh cookies.")
+        _session_valid_time = 0
+        return None
+    
+    if response.status_code != 200:
+        logger.debug("Opstra returned %s for %s", response.status_code, symbol)
+        return None
+    
+    # Extract IV values straight into an array (ignore nulls and zeros)
+    iv_values = _read_iv_values(response, stream)
+    iv_values = iv_values[iv_values > 0]
+    
+    if len(iv_values) < 30:
+        logger.debug("%s: Insufficient IV history from Opstra (%d days)", symbol, len(iv_values))
+        return None
+    
+    # Use last 252 trading days (1 year)
+    return iv_values[-252:]
+
+
+def store_opstra_iv(symbol, current_iv, iv_percentile, iv_rank):
+    """Build a symbol's Opstra result and write it to IV_CACHE and the disk cache."""
+    result = {
+        'iv': float(current_iv),
+        'iv_percentile': int(iv_percentile),
+        'iv_rank': int(iv_rank),
+        'source': 'opstra'
+    }
+    
+    # Cache the result
+    with _iv_cache_lock:
+        IV_CACHE[symbol.upper()] = {'data': result, 'timestamp': time.time()}
+    set_cached_iv(make_cache_key('opstra', symbol), result)
+    
+    logger.debug("Opstra IV for %s: IV=%.1f%%, IVP=%d%%, IVR=%d%%", 
+                symbol, result['iv'], result['iv_percentile'], result['iv_rank'])
+    return result
+
+
+def parse_opstra_response(symbol, response, stream=False):
+    """
+    Score an ivchart response and cache the result.
+    
+    Returns:
+        dict or None: As get_iv_from_opstra
+    """
+    window = extract_iv_window(symbol, response, stream)
+    if window is None:
+        return None
+    
+    # IV Percentile: % of days IV was at or below current;
+    # IV Rank: (current - min) / (max - min) * 100
+    current, percentile, rank = compute_iv_stats(window)
+    return store_opstra_iv(symbol, current[0], percentile[0], rank[0])
+
+
 def get_iv_from_opstra(symbol):
     """
     Fetch IV data from Opstra API.
@@ -85,78 +262,17 @@ def get_iv_from_opstra(symbol):
     if not is_opstra_configured():
         return None
     
-    # Check cache first
-    cache_key = symbol.upper()
-    if cache_key in IV_CACHE:
-        cached = IV_CACHE[cache_key]
-        if time.time() - cached['timestamp'] < IV_CACHE_DURATION:
-            return cached['data']
-    
-    headers = {
-        "accept": "application/json, text/plain, */*",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-GB,en-US;q=0.9,en;q=0.8",
-        "referer": "https://opstra.definedge.com/ivchart",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
+    # Memory, then disk cache
+    cached = get_cached_opstra_iv(symbol)
+    if cached:
+        return cached
     
     try:
-        url = f"https://opstra.definedge.com/api/ivcharts/{symbol.upper()}"
-        response = requests.get(url, headers=headers, cookies=OPSTRA_COOKIES, timeout=10)
-        
-        if response.status_code == 401:
-            logger.warning("Opstra session expired (401). Please refresh cookies.")
-            return None
-        
-        if response.status_code != 200:
-            logger.debug("Opstra returned %s for %s", response.status_code, symbol)
-            return None
-        
-        data = response.json()
-        ivchart = data.get("ivchart", [])
-        
-        if not ivchart:
-            return None
-        
-        # Extract IV values (ignore nulls)
-        iv_values = []
-        for point in ivchart:
-            iv = point.get("ImpVol")
-            if iv is not None and iv > 0:
-                iv_values.append(float(iv))
-        
-        if len(iv_values) < 30:
-            logger.debug("%s: Insufficient IV history from Opstra (%d days)", symbol, len(iv_values))
-            return None
-        
-        # Use last 252 trading days (1 year)
-        window = iv_values[-252:]
-        current_iv = window[-1]
-        
-        # IV Percentile: % of days where IV was lower than current
-        iv_percentile = int((np.sum(np.array(window) <= current_iv) / len(window)) * 100)
-        
-        # IV Rank: (current - min) / (max - min) * 100
-        iv_min = min(window)
-        iv_max = max(window)
-        if iv_max == iv_min:
-            iv_rank = 50
-        else:
-            iv_rank = int(((current_iv - iv_min) / (iv_max - iv_min)) * 100)
-        
-        result = {
-            'iv': current_iv,
-            'iv_percentile': iv_percentile,
-            'iv_rank': iv_rank,
-            'source': 'opstra'
-        }
-        
-        # Cache the result
-        IV_CACHE[cache_key] = {'data': result, 'timestamp': time.time()}
-        
-        logger.debug("Opstra IV for %s: IV=%.1f%%, IVP=%d%%, IVR=%d%%", 
-                    symbol, current_iv, iv_percentile, iv_rank)
-        return result
+        url = OPSTRA_IVCHART_URL.format(symbol=symbol.upper())
+        # Stream the body through ijson when available (only ImpVol is needed)
+        with _opstra_session.get(url, cookies=OPSTRA_COOKIES, timeout=10,
+                                 stream=IJSON_AVAILABLE) as response:
+            return parse_opstra_response(symbol, response, stream=IJSON_AVAILABLE)
     
     except requests.exceptions.Timeout:
         logger.debug("Opstra timeout for %s", symbol)
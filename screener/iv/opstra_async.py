@@ -0,0 +1,108 @@
+"""
+Async Opstra IV fetcher.
+
+Fetches ivchart data for many symbols concurrently with httpx.AsyncClient
+(HTTP/2 when h2 is installed), instead of one blocking request per symbol.
+All fetched IV histories are scored together as one (N, 252) block.
+"""
+
+import asyncio
+
+from screener.config import OPSTRA_COOKIES, IV_FETCH_WORKERS
+from screener.iv.opstra import (
+    OPSTRA_IVCHART_URL, OPSTRA_HEADERS, is_opstra_configured,
+    get_cached_opstra_iv, extract_iv_window, store_opstra_iv
+)
+from screener.iv.stats import compute_iv_stats, stack_windows
+from screener.utils.logging_setup import logger
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+
+async def _fetch_one(client, semaphore, symbol):
+    """Fetch one symbol's IV window (see extract_iv_window); None on any failure."""
+    url = OPSTRA_IVCHART_URL.format(symbol=symbol.upper())
+    try:
+        async with semaphore:
+            response = await client.get(url)
+        return extract_iv_window(symbol, response)
+    except httpx.TimeoutException:
+        logger.debug("Opstra timeout for %s", symbol)
+        return None
+    except Exception as e:
+        logger.debug("Opstra error for %s: %s", symbol, e)
+        return None
+
+
+async def get_iv_batch_async(symbols, max_concurrency=IV_FETCH_WORKERS):
+    """
+    Fetch Opstra IV for several symbols concurrently.
+
+    Cached symbols (memory or disk) are not requested again.
+
+    Args:
+        symbols: List of stock/index symbols
+        max_concurrency: Maximum requests in flight at once
+
+    Returns:
+        dict: symbol -> IV dict (as get_iv_from_opstra) or None
+    """
+    results = {}
+    if not is_opstra_configured():
+        return {symbol: None for symbol in symbols}
+
+    pending = []
+    for symbol in symbols:
+        cached = get_cached_opstra_iv(symbol)
+        if cached:
+            results[symbol] = cached
+        else:
+            pending.append(symbol)
+
+    if not pending:
+        return results
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Connection errors are retried twice, as on the sync session
+    transport = httpx.AsyncHTTPTransport(
+        http2=H2_AVAILABLE,
+        retries=2,
+        limits=httpx.Limits(max_connections=max_concurrency),
+    )
+    async with httpx.AsyncClient(
+        transport=transport,
+        headers=OPSTRA_HEADERS,
+        cookies=dict(OPSTRA_COOKIES),
+        timeout=10.0,
+    ) as client:
+        fetched = await asyncio.gather(
+            *[_fetch_one(client, semaphore, symbol) for symbol in pending]
+        )
+
+    scored = [(symbol, window) for symbol, window in zip(pending, fetched) if window is not None]
+    results.update((symbol, None) for symbol in pending)
+    if scored:
+        current, percentile, rank = compute_iv_stats(stack_windows([w for _, w in scored]))
+        for i, (symbol, _) in enumerate(scored):
+            results[symbol] = store_opstra_iv(symbol, current[i], percentile[i], rank[i])
+    return results
+
+
+def get_iv_batch(symbols, max_concurrency=IV_FETCH_WORKERS):
+    """
+    Synchronous wrapper around get_iv_batch_async.
+
+    Runs its own event loop, so it must not be called from inside a
+    running asyncio loop.
+    """
+    return asyncio.run(get_iv_batch_async(list(symbols), max_concurrency))
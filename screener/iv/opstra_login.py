@@ -2,7 +2,8 @@
 Opstra Auto-Login with Persistent Chrome Profile.
 
 Uses Selenium with a persistent Chrome profile to automatically extract
-Opstra session cookies without manual daily login.
+Opstra session cookies without manual daily login. When browser_cookie3 is
+installed, cookies already in a Chrome cookie store are used first.
 
 First run: Opens browser for manual Google login (profile saved)
 Subsequent runs: Uses saved profile, no manual login needed
@@ -10,17 +11,10 @@ Subsequent runs: Uses saved profile, no manual login needed
 
 import os
 import time
-import subprocess
 from pathlib import Path
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-
+# selenium / webdriver_manager / undetected_chromedriver are imported inside
+# the browser functions: they are slow to import and most runs never need them
 from screener.utils.logging_setup import logger
 
 # Default Chrome profile path
@@ -42,6 +36,10 @@ def get_opstra_cookies_via_browser(force_login=False, headless=False, timeout=12
     
     Returns:
         dict: {'JSESSIONID': '...', 'DSESSIONID': '...'} or None on failure
+    
+    Raises:
+        ImportError: If neither undetected-chromedriver nor selenium and
+            webdriver-manager are installed
     """
     from screener.config import CHROME_PROFILE_PATH
     
@@ -131,6 +129,12 @@ def _get_cookies_standard(profile_path, profile_exists, force_login, headless, t
     Use standard Selenium with maximum anti-detection measures.
     Note: Google may still block this. Use undetected-chromedriver if issues persist.
     """
+    # ImportError propagates: callers show the selenium install hint
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+    
     options = Options()
     
     # Use persistent profile directory
@@ -225,6 +229,45 @@ def _get_cookies_standard(profile_path, profile_exists, force_login, headless, t
             driver.quit()
 
 
+def _get_cookies_from_chrome_store(profile_path=None):
+    """
+    Read Opstra session cookies straight from a Chrome cookie store on disk.
+    
+    Tries the user's regular Chrome profile, then the saved Selenium profile
+    (if given). Needs the optional browser_cookie3 package; takes
+    milliseconds instead of the seconds a browser launch costs.
+    
+    Returns:
+        dict with JSESSIONID and DSESSIONID if both found, None otherwise
+    """
+    try:
+        import browser_cookie3
+    except ImportError:
+        return None
+    
+    cookie_files = [None]  # None = browser_cookie3's default Chrome profile
+    if profile_path:
+        cookie_files += [
+            os.path.join(profile_path, 'Default', 'Network', 'Cookies'),
+            os.path.join(profile_path, 'Default', 'Cookies'),
+        ]
+    
+    for cookie_file in cookie_files:
+        if cookie_file and not os.path.exists(cookie_file):
+            continue
+        try:
+            jar = browser_cookie3.chrome(cookie_file=cookie_file, domain_name='opstra.definedge.com')
+        except Exception as e:
+            logger.debug("Chrome cookie store read failed (%s): %s", cookie_file or 'default', e)
+            continue
+        
+        cookies = {c.name: c.value for c in jar if c.name in ('JSESSIONID', 'DSESSIONID')}
+        if cookies.get('JSESSIONID') and cookies.get('DSESSIONID'):
+            return cookies
+    
+    return None
+
+
 def _get_session_cookies(driver):
     """
     Extract JSESSIONID and DSESSIONID from browser cookies.
@@ -306,6 +349,10 @@ def refresh_opstra_session(force_login=False, headless=False):
     
     Returns:
         bool: True if cookies were successfully refreshed
+    
+    Raises:
+        ImportError: If a browser login is needed but no Selenium driver is
+            installed
     """
     from screener.iv.opstra import set_opstra_cookies, validate_opstra_session
     
@@ -314,12 +361,22 @@ def refresh_opstra_session(force_login=False, headless=False):
         logger.info("Opstra session is already valid. Skipping browser refresh.")
         return True
     
-    logger.info("Refreshing Opstra session via browser...")
-    
-    # Try headless first if profile likely exists
     from screener.config import CHROME_PROFILE_PATH
     profile_path = CHROME_PROFILE_PATH or DEFAULT_CHROME_PROFILE
     
+    # Cookies already in a Chrome cookie store skip the browser entirely
+    if not force_login:
+        cookies = _get_cookies_from_chrome_store(profile_path)
+        if cookies:
+            set_opstra_cookies(cookies['JSESSIONID'], cookies['DSESSIONID'])
+            if validate_opstra_session():
+                logger.info("Opstra cookies read from Chrome cookie store.")
+                return True
+            logger.debug("Chrome cookie store has an expired Opstra session")
+    
+    logger.info("Refreshing Opstra session via browser...")
+    
+    # Try headless first if profile likely exists
     if os.path.exists(profile_path) and not force_login:
         logger.info("Using saved Chrome profile: %s", profile_path)
         cookies = get_opstra_cookies_via_browser(force_login=False, headless=True, timeout=30)
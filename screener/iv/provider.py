@@ -4,8 +4,12 @@ Unified IV data provider.
 Provides a single interface that tries multiple data sources.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+from screener.config import IV_FETCH_WORKERS
 from screener.iv.opstra import get_iv_from_opstra, is_opstra_configured
-from screener.iv.historical import calculate_historical_volatility
+from screener.iv.opstra_async import get_iv_batch, HTTPX_AVAILABLE
+from screener.iv.historical import calculate_historical_volatility, calculate_historical_volatility_batch
 from screener.utils.logging_setup import logger
 
 
@@ -49,7 +53,11 @@ def get_iv_data(symbol):
     if hv_data:
         return hv_data
     
-    # Last resort: return defaults with warning
+    return _default_iv_data(symbol)
+
+
+def _default_iv_data(symbol):
+    """Last resort: return defaults with warning."""
     logger.debug("%s: Using default IV values (no data available)", symbol)
     return {
         'iv': 0,
@@ -58,3 +66,48 @@ def get_iv_data(symbol):
         'source': 'default'  # Clearly marked as unreliable
     }
 
+
+def get_iv_data_batch(symbols, max_workers=IV_FETCH_WORKERS):
+    """
+    Get IV data for several symbols, with the same fallback chain as get_iv_data.
+    
+    Opstra requests run concurrently (async httpx client when installed,
+    otherwise a thread pool); the HV fallback for all remaining symbols is
+    prefetched with one batched yfinance download.
+    
+    Args:
+        symbols: Iterable of stock/index symbols
+        max_workers: Maximum concurrent Opstra requests
+    
+    Returns:
+        dict: symbol -> IV data dict (as get_iv_data)
+    """
+    symbols = list(dict.fromkeys(symbols))
+    results = {}
+    if not symbols:
+        return results
+    
+    # Try Opstra first (unless skipped)
+    if not _SKIP_OPSTRA and is_opstra_configured():
+        opstra_batch = None
+        if HTTPX_AVAILABLE:
+            try:
+                opstra_batch = get_iv_batch(symbols, max_workers)
+            except RuntimeError as e:  # e.g. called from inside an event loop
+                logger.debug("Async Opstra fetch unavailable (%s), using threads", e)
+        if opstra_batch is None:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                opstra_batch = dict(zip(symbols, executor.map(get_iv_from_opstra, symbols)))
+        results.update((symbol, data) for symbol, data in opstra_batch.items() if data)
+    
+    # Fallback to Historical Volatility, downloaded in one batch
+    missing = [symbol for symbol in symbols if symbol not in results]
+    hv_batch = calculate_historical_volatility_batch(missing) if missing else {}
+    for symbol in missing:
+        if symbol in hv_batch:
+            hv_data = hv_batch[symbol]
+        else:
+            hv_data = calculate_historical_volatility(symbol)
+        results[symbol] = hv_data or _default_iv_data(symbol)
+    
+    return results
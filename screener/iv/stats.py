@@ -0,0 +1,70 @@
+"""
+IV percentile and IV rank statistics.
+
+Shared by the Opstra IV and historical volatility providers. Works on
+one symbol or on a block of symbols at once.
+"""
+
+import numpy as np
+
+
+def percentile_and_rank(current, n_le, lo, hi, n_valid):
+    """
+    IV percentile and IV rank from a series' summary figures.
+
+    Accepts scalars or equal-length arrays.
+
+    Args:
+        current: Latest value
+        n_le: Number of values <= current
+        lo, hi: Series minimum and maximum
+        n_valid: Number of values in the series
+
+    Returns:
+        tuple: (percentile, rank) as int arrays. Percentile is the % of
+        values <= current; rank is (current - min) / (max - min) * 100,
+        or 50 for a flat series.
+    """
+    current = np.asarray(current, dtype=np.float64)
+    span = np.asarray(hi, dtype=np.float64) - lo
+    percentile = (np.asarray(n_le) / n_valid * 100).astype(int)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rank = np.where(span == 0, 50, (current - lo) / span * 100).astype(int)
+    return percentile, rank
+
+
+def stack_windows(windows):
+    """
+    Stack 1-D series of different lengths into an (N, W) block.
+
+    Shorter series are left-padded with NaN, so the latest value of every
+    row is in the last column.
+    """
+    width = max((len(w) for w in windows), default=0)
+    block = np.full((len(windows), width), np.nan)
+    for i, w in enumerate(windows):
+        if len(w):
+            block[i, width - len(w):] = w
+    return block
+
+
+def compute_iv_stats(windows):
+    """
+    Current value, IV percentile and IV rank for each row of a block.
+
+    Args:
+        windows: (N, W) array, one symbol's history per row (oldest first),
+            NaN-padded on the left (see stack_windows). Every row needs at
+            least its last value.
+
+    Returns:
+        tuple: (current, percentile, rank) arrays of length N
+    """
+    windows = np.atleast_2d(np.asarray(windows, dtype=np.float64))
+    current = windows[:, -1]
+    n_valid = np.count_nonzero(~np.isnan(windows), axis=1)
+    n_le = np.count_nonzero(windows <= current[:, None], axis=1)
+    lo = np.nanmin(windows, axis=1)
+    hi = np.nanmax(windows, axis=1)
+    percentile, rank = percentile_and_rank(current, n_le, lo, hi, n_valid)
+    return current, percentile, rank
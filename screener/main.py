@@ -9,18 +9,25 @@ Run the screener:
 """
 
 import argparse
+import logging
+import threading
+from collections import Counter
 import time
-import schedule
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 from screener.config import (
     INDEX_SYMBOLS, STOCK_SYMBOLS, ALLOW_AFTER_HOURS_SCAN,
-    AFTER_HOURS_OI_THRESHOLD_STOCK, AFTER_HOURS_OI_THRESHOLD_INDEX
+    AFTER_HOURS_OI_THRESHOLD_STOCK, AFTER_HOURS_OI_THRESHOLD_INDEX,
+    SCAN_WORKERS, SCAN_MIN_INTERVAL, CSV_FILE, JSON_FILE
 )
 from screener.api.market_status import is_market_hours, get_india_vix, determine_market_regime
+from screener.api.option_chain import fetch_many_option_chains
 from screener.iv.opstra import is_opstra_configured, set_opstra_cookies
+from screener.iv.provider import get_iv_data_batch
 from screener.scanners.stock import scan_stock
 from screener.scanners.index import scan_index
-from screener.output.csv_logger import log_to_csv
+from screener.output.csv_logger import log_alerts_batch_to_csv
 from screener.output.json_logger import log_alerts_batch_to_json
 from screener.utils.logging_setup import logger
 
@@ -62,6 +69,76 @@ def _setup_opstra_session(force_refresh=False, skip_opstra=False):
         return False
 
 
+class _RateLimiter:
+    """Spaces out calls to wait() by at least min_interval seconds, across threads."""
+    
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _scan_parallel(symbols, scan_fn, progress, progress_every):
+    """
+    Run scan_fn(symbol) for each symbol on a thread pool.
+    
+    Scans start at most once per SCAN_MIN_INTERVAL seconds (the old
+    sequential loop's pacing) but their network waits overlap.
+    
+    Args:
+        symbols: Symbols to scan
+        scan_fn: Callable taking a symbol and returning a list of alerts
+        progress: Callable taking a progress message
+        progress_every: Report progress after every N completed symbols
+    
+    Returns:
+        list: All alerts, in symbol order
+    """
+    limiter = _RateLimiter(SCAN_MIN_INTERVAL)
+    lock = threading.Lock()
+    completed = [0]
+    total = len(symbols)
+    
+    def _run(sym):
+        limiter.wait()
+        try:
+            alerts = scan_fn(sym)
+        except Exception as e:
+            logger.warning("Scan failed for %s: %s", sym, e)
+            alerts = []
+        with lock:
+            completed[0] += 1
+            done = completed[0]
+        if done % progress_every == 0:
+            progress(f"Progress: {done}/{total}...")
+        return alerts
+    
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        results = list(executor.map(_run, symbols))
+    return [alert for alerts in results for alert in alerts]
+
+
+def _dedupe_alerts(alerts):
+    """
+    Drop repeated (strategy, symbol, strike) alerts, keeping the first of each, in order.
+    
+    Also defaults a missing 'volume' to 0, so callers can sort on itemgetter('volume').
+    """
+    unique = {}
+    for a in alerts:
+        a.setdefault('volume', 0)
+        unique.setdefault((a['strategy'], a['symbol'], a['strike']), a)
+    return list(unique.values())
+
+
 def job():
     """
     Main scanning job. Scans all configured indices and stocks.
@@ -70,7 +147,8 @@ def job():
     logger.info("Starting scan...")
     
     market_open = is_market_hours()
-    opstra_status = "CONFIGURED" if is_opstra_configured() else "NOT SET (using HV fallback)"
+    opstra_configured = is_opstra_configured()
+    opstra_status = "CONFIGURED" if opstra_configured else "NOT SET (using HV fallback)"
     
     # Check if we should skip scanning when market is closed
     if not market_open and not ALLOW_AFTER_HOURS_SCAN:
@@ -95,45 +173,64 @@ def job():
     
     all_alerts = []
     
+    # Fetch all option chains up front, in parallel
+    logger.info("Fetching option chains (%d symbols)...", len(INDEX_SYMBOLS) + len(STOCK_SYMBOLS))
+    chains = fetch_many_option_chains(
+        [(sym, True) for sym in INDEX_SYMBOLS] + [(sym, False) for sym in STOCK_SYMBOLS]
+    )
+    logger.info("Fetching IV data...")
+    iv_by_symbol = get_iv_data_batch([*INDEX_SYMBOLS, *STOCK_SYMBOLS])
+    
     # Scan indices
     logger.info("\n--- Scanning Indices ---")
-    for sym in INDEX_SYMBOLS:
-        alerts = scan_index(sym, 60, regime, vix, market_open)
-        all_alerts.extend(alerts)
+    all_alerts.extend(_scan_parallel(
+        INDEX_SYMBOLS,
+        lambda sym: scan_index(sym, 60, regime, vix, market_open, option_chain=chains.get(sym),
+                               iv_data=iv_by_symbol.get(sym)),
+        logger.info, 20
+    ))
     
     # Scan stocks
     logger.info("\n--- Scanning Stocks (%d) ---", len(STOCK_SYMBOLS))
-    for i, sym in enumerate(STOCK_SYMBOLS):
-        if (i + 1) % 20 == 0:
-            logger.info("Progress: %d/%d...", i + 1, len(STOCK_SYMBOLS))
-        alerts = scan_stock(sym, regime, vix, market_open)
-        all_alerts.extend(alerts)
-        time.sleep(0.3)
+    all_alerts.extend(_scan_parallel(
+        STOCK_SYMBOLS,
+        lambda sym: scan_stock(sym, regime, vix, market_open, option_chain=chains.get(sym),
+                               iv_data=iv_by_symbol.get(sym)),
+        logger.info, 20
+    ))
     
     # Deduplicate
-    seen = set()
-    unique_alerts = []
-    for a in all_alerts:
-        key = (a['strategy'], a['symbol'], a['strike'])
-        if key not in seen:
-            seen.add(key)
-            unique_alerts.append(a)
+    unique_alerts = _dedupe_alerts(all_alerts)
     
-    unique_alerts.sort(key=lambda x: x.get('volume', 0), reverse=True)
+    unique_alerts.sort(key=itemgetter('volume'), reverse=True)
     
     logger.info("=" * 100)
     logger.info("SCAN COMPLETE: %d unique alerts", len(unique_alerts))
     logger.info("=" * 100)
     
     if unique_alerts:
-        _print_top_alerts(unique_alerts)
+        _print_top_alerts(unique_alerts, opstra_configured)
         _save_alerts(unique_alerts)
     else:
         logger.info("\nNo alerts generated.")
 
 
-def _print_top_alerts(unique_alerts):
-    """Print top 15 alerts by volume."""
+# Row layout of the top-alerts table printed by _print_top_alerts
+_ROW_FMT = "%-3d %-10s %-6s %-4s %-10s ₹%-9.2f %-7d ₹%-10.0f %-10s %-4d %-12s %-8s"
+
+
+def _print_top_alerts(unique_alerts, opstra_configured):
+    """
+    Print top 15 alerts by volume.
+    
+    Args:
+        unique_alerts: Alerts sorted by volume
+        opstra_configured: Opstra state checked at the start of the scan
+    """
+    # Nothing below is visible when INFO is suppressed; skip the formatting
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     logger.info("\n" + "=" * 120)
     logger.info("TOP 15 ALERTS BY VOLUME")
     logger.info("=" * 120)
@@ -143,7 +240,8 @@ def _print_top_alerts(unique_alerts):
                "COST", "BREAKEVEN", "DTE", "DISTANCE", "IV_SRC")
     logger.info("-" * 120)
     
-    for i, alert in enumerate(unique_alerts[:15]):
+    top_alerts = unique_alerts[:15]
+    for i, alert in enumerate(top_alerts):
         iv_src = alert.get('iv_source', '?')[:3].upper()
         # Handle breakeven - can be number or string for multi-leg strategies
         breakeven = alert.get('breakeven', 0)
@@ -152,7 +250,7 @@ def _print_top_alerts(unique_alerts):
         else:
             breakeven_str = str(breakeven)[:10]  # Truncate if too long
         
-        logger.info("%-3d %-10s %-6s %-4s %-10s ₹%-9.2f %-7d ₹%-10.0f %-10s %-4d %-12s %-8s",
+        logger.info(_ROW_FMT,
                    i+1, alert['symbol'],
                    alert['strategy'].replace('Long ', ''),
                    alert.get('moneyness', '')[:3],
@@ -164,10 +262,11 @@ def _print_top_alerts(unique_alerts):
     
     logger.info("-" * 120)
     
-    # IV source summary
-    opstra_count = sum(1 for a in unique_alerts if a.get('iv_source') == 'opstra')
-    hv_count = sum(1 for a in unique_alerts if a.get('iv_source') == 'hv_calculated')
-    default_count = sum(1 for a in unique_alerts if a.get('iv_source') == 'default')
+    # IV source summary (one pass over the alerts)
+    iv_counts = Counter(a.get('iv_source') for a in unique_alerts)
+    opstra_count = iv_counts['opstra']
+    hv_count = iv_counts['hv_calculated']
+    default_count = iv_counts['default']
     
     logger.info("\nIV Data Sources: Opstra=%d | HV Calculated=%d | Default=%d",
                opstra_count, hv_count, default_count)
@@ -175,18 +274,15 @@ def _print_top_alerts(unique_alerts):
     if default_count > 0:
         logger.info("WARNING: %d alerts have no reliable IV data", default_count)
     
-    if not is_opstra_configured():
+    if not opstra_configured:
         logger.info("\nTIP: Configure Opstra cookies for accurate IV data:")
         logger.info("   set_opstra_cookies('your_jsessionid', 'your_dsessionid')")
 
 
 def _save_alerts(unique_alerts):
     """Save alerts to CSV and JSON files."""
-    from screener.config import CSV_FILE, JSON_FILE
-    
-    # Save to CSV
-    for alert in unique_alerts:
-        log_to_csv(alert)
+    # Save to CSV (one append for the whole batch)
+    log_alerts_batch_to_csv(unique_alerts)
     
     # Save to JSON (batch for efficiency)
     log_alerts_batch_to_json(unique_alerts)
@@ -251,9 +347,10 @@ def run_scan_with_config(
     market_open = is_market_hours()
     
     # Determine Opstra status
+    opstra_configured = is_opstra_configured()
     if skip_opstra:
         opstra_status = "SKIPPED (using HV only)"
-    elif is_opstra_configured():
+    elif opstra_configured:
         opstra_status = "CONFIGURED"
     else:
         opstra_status = "NOT SET (using HV fallback)"
@@ -275,45 +372,49 @@ def run_scan_with_config(
     
     all_alerts = []
     
+    # Fetch all option chains up front, in parallel
+    _progress(f"Fetching option chains ({len(scan_indices) + len(scan_stocks)} symbols)...")
+    chains = fetch_many_option_chains(
+        [(sym, True) for sym in scan_indices] + [(sym, False) for sym in scan_stocks]
+    )
+    _progress("Fetching IV data...")
+    iv_by_symbol = get_iv_data_batch([*scan_indices, *scan_stocks])
+    
     # Scan indices
     if scan_indices:
         _progress(f"\n--- Scanning Indices ({len(scan_indices)}) ---")
-        for sym in scan_indices:
-            alerts = scan_index(sym, 60, regime, vix, market_open)
-            all_alerts.extend(alerts)
+        all_alerts.extend(_scan_parallel(
+            scan_indices,
+            lambda sym: scan_index(sym, 60, regime, vix, market_open, option_chain=chains.get(sym),
+                                   iv_data=iv_by_symbol.get(sym)),
+            _progress, 10
+        ))
     
     # Scan stocks
     if scan_stocks:
         _progress(f"\n--- Scanning Stocks ({len(scan_stocks)}) ---")
-        total_stocks = len(scan_stocks)
-        for i, sym in enumerate(scan_stocks):
-            if (i + 1) % 10 == 0:
-                _progress(f"Progress: {i + 1}/{total_stocks}...")
-            alerts = scan_stock(sym, regime, vix, market_open)
-            all_alerts.extend(alerts)
-            time.sleep(0.3)
+        all_alerts.extend(_scan_parallel(
+            scan_stocks,
+            lambda sym: scan_stock(sym, regime, vix, market_open, option_chain=chains.get(sym),
+                                   iv_data=iv_by_symbol.get(sym)),
+            _progress, 10
+        ))
     
     # Filter by enabled strategies if specified
     if enabled_strategies:
         all_alerts = [a for a in all_alerts if a.get('strategy') in enabled_strategies]
     
     # Deduplicate
-    seen = set()
-    unique_alerts = []
-    for a in all_alerts:
-        key = (a['strategy'], a['symbol'], a['strike'])
-        if key not in seen:
-            seen.add(key)
-            unique_alerts.append(a)
+    unique_alerts = _dedupe_alerts(all_alerts)
     
-    unique_alerts.sort(key=lambda x: x.get('volume', 0), reverse=True)
+    unique_alerts.sort(key=itemgetter('volume'), reverse=True)
     
     _progress("=" * 80)
     _progress(f"SCAN COMPLETE: {len(unique_alerts)} unique alerts")
     _progress("=" * 80)
     
     if unique_alerts:
-        _print_top_alerts(unique_alerts)
+        _print_top_alerts(unique_alerts, opstra_configured)
         _save_alerts(unique_alerts)
     else:
         _progress("\nNo alerts generated.")
@@ -347,13 +448,13 @@ def run_scheduler(interval_seconds=300, force_refresh_opstra=False, skip_opstra=
     # Run once immediately
     job()
     
-    # Schedule recurring runs
-    schedule.every(interval_seconds).seconds.do(job)
+    # Recurring runs: sleep straight through to the next scan (interval
+    # measured from the end of the previous one) instead of polling
     logger.info("\nScheduler started. Press Ctrl+C to stop.")
     
     while True:
-        schedule.run_pending()
-        time.sleep(1)
+        time.sleep(interval_seconds)
+        job()
 
 
 def run_once(force_refresh_opstra=False, skip_opstra=False):
@@ -1,7 +1,7 @@
 """Output logging for CSV and JSON formats."""
 
-from screener.output.csv_logger import log_to_csv, initialize_csv
+from screener.output.csv_logger import log_to_csv, log_alerts_batch_to_csv, initialize_csv
 from screener.output.json_logger import log_to_json, log_alerts_batch_to_json
 
-__all__ = ["log_to_csv", "initialize_csv", "log_to_json", "log_alerts_batch_to_json"]
+__all__ = ["log_to_csv", "log_alerts_batch_to_csv", "initialize_csv", "log_to_json", "log_alerts_batch_to_json"]
 
@@ -17,24 +17,12 @@ from screener.utils.logging_setup import logger
 
 RISK_FREE_RATE = 0.066  # 6.6% - India 10Y bond rate
 STT_RATE = 0.00125      # 0.125% STT on exercise
+_SQRT2 = math.sqrt(2.0)
 
 
 def _norm_cdf(x: float) -> float:
-    """Cumulative normal distribution using Abramowitz/Stegun approximation."""
-    a1 = 0.254829592
-    a2 = -0.284496736
-    a3 = 1.421413741
-    a4 = -1.453152027
-    a5 = 1.061405429
-    p = 0.3275911
-    
-    sign = 1 if x >= 0 else -1
-    x = abs(x)
-    
-    t = 1.0 / (1.0 + p * x)
-    y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * math.exp(-x * x / 2)
-    
-    return 0.5 * (1.0 + sign * y)
+    """Cumulative normal distribution (erfc form, exact to double precision)."""
+    return 0.5 * math.erfc(-x / _SQRT2)
 
 
 def _calculate_d2(spot: float, target_price: float, time_years: float, 
@@ -234,13 +222,16 @@ def initialize_csv():
         logger.info("CSV file created and headers written")
 
 
-def log_to_csv(alert):
+def _csv_row(alert):
     """
-    Log alert to CSV file, handling both single-leg and multi-leg strategies.
-    Includes probability of profit calculations.
+    Build the CSV row for an alert, handling both single-leg and multi-leg
+    strategies. Includes probability of profit calculations.
     
     Args:
         alert: Alert dictionary with trade details
+    
+    Returns:
+        list: Values in CSV_HEADERS order
     """
     # Handle breakeven - can be number or string for multi-leg strategies
     breakeven = alert.get('breakeven', 0)
@@ -250,52 +241,78 @@ def log_to_csv(alert):
     # Calculate probability data
     prob_data = calculate_probability_for_csv(alert)
     
+    return [
+        alert.get('timestamp', ''),
+        alert.get('symbol', ''),
+        alert.get('instrument_type', ''),
+        alert.get('strategy', ''),
+        alert.get('strike', ''),
+        round(alert.get('premium', 0), 2),
+        alert.get('price_source', 'ask'),
+        round(alert.get('spot', 0), 2),
+        alert.get('volume', 0),
+        alert.get('open_interest', 0),
+        alert.get('oi_change', 0),
+        round(alert.get('iv', 0), 2),
+        alert.get('iv_percentile', 0),
+        alert.get('iv_rank', 0),
+        alert.get('iv_source', 'unknown'),
+        alert.get('market_regime', ''),
+        round(alert.get('rsi', 0), 1),
+        alert.get('tier', ''),
+        alert.get('moneyness', ''),
+        alert.get('expiry', ''),
+        alert.get('days_to_expiry', 0),
+        alert.get('lot_size', 0),
+        round(alert.get('total_cost', 0), 2),
+        breakeven,
+        alert.get('distance_from_spot', ''),
+        # Probability of Profit fields
+        prob_data['pop_raw'],
+        prob_data['pop_stt_adjusted'],
+        prob_data['tax_risk'],
+        prob_data['prob_itm'],
+        prob_data['prob_max_profit'],
+        prob_data['breakeven_stt'],
+        prob_data['stt_cost'],
+        # Multi-leg strategy fields
+        alert.get('leg1_strike', ''),
+        round(alert.get('leg1_premium', 0), 2) if alert.get('leg1_premium') else '',
+        alert.get('leg1_action', ''),
+        alert.get('leg2_strike', ''),
+        round(alert.get('leg2_premium', 0), 2) if alert.get('leg2_premium') else '',
+        alert.get('leg2_action', ''),
+        round(alert.get('max_profit', 0), 2) if alert.get('max_profit') else '',
+        round(alert.get('max_loss', 0), 2) if alert.get('max_loss') else '',
+        round(alert.get('reward_ratio', 0), 2) if alert.get('reward_ratio') else ''
+    ]
+
+
+def log_to_csv(alert):
+    """
+    Log alert to CSV file, handling both single-leg and multi-leg strategies.
+    Includes probability of profit calculations.
+    
+    Args:
+        alert: Alert dictionary with trade details
+    """
+    with open(CSV_FILE, mode='a', newline='') as f:
+        csv.writer(f).writerow(_csv_row(alert))
+
+
+def log_alerts_batch_to_csv(alerts):
+    """
+    Log several alerts to the CSV file with a single open and writerows call.
+    
+    Args:
+        alerts: List of alert dictionaries
+    """
+    if not alerts:
+        return
+    
+    rows = [_csv_row(alert) for alert in alerts]
     with open(CSV_FILE, mode='a', newline='') as f:
-        csv.writer(f).writerow([
-            alert.get('timestamp', ''),
-            alert.get('symbol', ''),
-            alert.get('instrument_type', ''),
-            alert.get('strategy', ''),
-            alert.get('strike', ''),
-            round(alert.get('premium', 0), 2),
-            alert.get('price_source', 'ask'),
-            round(alert.get('spot', 0), 2),
-            alert.get('volume', 0),
-            alert.get('open_interest', 0),
-            alert.get('oi_change', 0),
-            round(alert.get('iv', 0), 2),
-            alert.get('iv_percentile', 0),
-            alert.get('iv_rank', 0),
-            alert.get('iv_source', 'unknown'),
-            alert.get('market_regime', ''),
-            round(alert.get('rsi', 0), 1),
-            alert.get('tier', ''),
-            alert.get('moneyness', ''),
-            alert.get('expiry', ''),
-            alert.get('days_to_expiry', 0),
-            alert.get('lot_size', 0),
-            round(alert.get('total_cost', 0), 2),
-            breakeven,
-            alert.get('distance_from_spot', ''),
-            # Probability of Profit fields
-            prob_data['pop_raw'],
-            prob_data['pop_stt_adjusted'],
-            prob_data['tax_risk'],
-            prob_data['prob_itm'],
-            prob_data['prob_max_profit'],
-            prob_data['breakeven_stt'],
-            prob_data['stt_cost'],
-            # Multi-leg strategy fields
-            alert.get('leg1_strike', ''),
-            round(alert.get('leg1_premium', 0), 2) if alert.get('leg1_premium') else '',
-            alert.get('leg1_action', ''),
-            alert.get('leg2_strike', ''),
-            round(alert.get('leg2_premium', 0), 2) if alert.get('leg2_premium') else '',
-            alert.get('leg2_action', ''),
-            round(alert.get('max_profit', 0), 2) if alert.get('max_profit') else '',
-            round(alert.get('max_loss', 0), 2) if alert.get('max_loss') else '',
-            round(alert.get('reward_ratio', 0), 2) if alert.get('reward_ratio') else ''
-        ])
+        csv.writer(f).writerows(rows)
 
 
 # Initialize CSV on module import
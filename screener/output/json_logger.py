@@ -19,24 +19,12 @@ from screener.utils.logging_setup import logger
 # Indian market constants
 RISK_FREE_RATE = 0.066  # 6.6% - India 10Y bond rate
 STT_RATE = 0.00125      # 0.125% STT on exercise
+_SQRT2 = math.sqrt(2.0)
 
 
 def _norm_cdf(x: float) -> float:
-    """Cumulative normal distribution using Abramowitz/Stegun approximation."""
-    a1 = 0.254829592
-    a2 = -0.284496736
-    a3 = 1.421413741
-    a4 = -1.453152027
-    a5 = 1.061405429
-    p = 0.3275911
-    
-    sign = 1 if x >= 0 else -1
-    x = abs(x)
-    
-    t = 1.0 / (1.0 + p * x)
-    y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * math.exp(-x * x / 2)
-    
-    return 0.5 * (1.0 + sign * y)
+    """Cumulative normal distribution (erfc form, exact to double precision)."""
+    return 0.5 * math.erfc(-x / _SQRT2)
 
 
 def _calculate_d2(spot: float, target_price: float, time_years: float, 
@@ -4,6 +4,8 @@ Index options scanner.
 
 from datetime import datetime
 
+import numpy as np
+
 from screener.config import (
     IST, VOLUME_THRESHOLD_INDEX, OI_THRESHOLD_INDEX,
     AFTER_HOURS_OI_THRESHOLD_INDEX, AFTER_HOURS_SPREAD_PCT,
@@ -11,11 +13,12 @@ from screener.config import (
     MIN_PREMIUM_INDEX, STRIKE_RANGE_MULTIPLIER
 )
 from screener.api.option_chain import fetch_nse_option_chain
+from screener.api.market_status import get_index_spot
 from screener.iv.provider import get_iv_data
 from screener.utils.helpers import (
     get_lot_size, find_atm_strike, get_moneyness,
     calculate_breakeven, calculate_distance_from_spot, calculate_days_to_expiry,
-    get_option_price, get_option_spread, get_underlying_price
+    get_option_price, get_option_spread, get_underlying_price, liquid_strike_mask
 )
 from screener.utils.logging_setup import logger
 from screener.strategies.bull_call_spread import scan_bull_call_spread
@@ -24,7 +27,7 @@ from screener.strategies.long_straddle import scan_long_straddle
 from screener.strategies.long_strangle import scan_long_strangle
 
 
-def scan_index(symbol, iv_threshold, market_regime, vix, market_open=True):
+def scan_index(symbol, iv_threshold, market_regime, vix, market_open=True, option_chain=None, iv_data=None):
     """
     Scan an index for option trading opportunities.
     
@@ -34,6 +37,9 @@ def scan_index(symbol, iv_threshold, market_regime, vix, market_open=True):
         market_regime: Current market volatility regime
         vix: Current India VIX value
         market_open: Whether market is currently open
+        option_chain: Pre-fetched option chain (see fetch_many_option_chains);
+            fetched here when None
+        iv_data: Pre-fetched IV data (see get_iv_data_batch); fetched here when None
     
     Returns:
         list: List of alert dictionaries
@@ -55,19 +61,21 @@ def scan_index(symbol, iv_threshold, market_regime, vix, market_open=True):
             spread_limit = AFTER_HOURS_SPREAD_PCT
             min_premium = MIN_PREMIUM_INDEX
         
-        spot = get_underlying_price(symbol)
+        # NSE allIndices snapshot (shared with the VIX lookup), else yfinance
+        spot = get_index_spot(symbol) or get_underlying_price(symbol)
         if not spot:
             return []
         
-        # Get IV data for index
-        iv_data = get_iv_data(symbol)
+        # Get IV data for index (unless pre-fetched)
+        if iv_data is None:
+            iv_data = get_iv_data(symbol)
         
         logger.info("Index %s: Spot=%.0f | IV=%.1f%% IVP=%d%% [%s] | Mode=%s",
                    symbol, spot, iv_data['iv'], iv_data['iv_percentile'], 
                    iv_data['source'].upper(), "LIVE" if market_open else "AFTER-HOURS")
         
-        # Fetch option chain using NSE API v3
-        oc = fetch_nse_option_chain(symbol, is_index=True)
+        # Fetch option chain using NSE API v3 (unless pre-fetched)
+        oc = option_chain if option_chain is not None else fetch_nse_option_chain(symbol, is_index=True)
         
         if not oc or 'records' not in oc:
             logger.warning("Index %s: Option chain data unavailable", symbol)
@@ -102,7 +110,17 @@ def scan_index(symbol, iv_threshold, market_regime, vix, market_open=True):
         atm = find_atm_strike(strikes, spot)
         step = strikes[1] - strikes[0] if len(strikes) > 1 else (100 if symbol == "BANKNIFTY" else 50)
         max_distance = step * STRIKE_RANGE_MULTIPLIER
-        strikes_in_range = [s for s in strikes if abs(s - atm) <= max_distance]
+        
+        # Strike-range and Volume/OI filters on the columnar view
+        cols = oc['records']['columns']
+        in_range = (cols['strike'] > 0) & (np.abs(cols['strike'] - atm) <= max_distance)
+        strikes_in_range = sorted({records[i]['strikePrice'] for i in np.flatnonzero(in_range)})
+        liquid_calls = {records[i]['strikePrice'] for i in np.flatnonzero(
+            in_range & liquid_strike_mask(cols['ce_volume'], cols['ce_oi'], vol_thresh, oi_thresh, market_open)
+        )}
+        liquid_puts = {records[i]['strikePrice'] for i in np.flatnonzero(
+            in_range & liquid_strike_mask(cols['pe_volume'], cols['pe_oi'], vol_thresh, oi_thresh, market_open)
+        )}
         
         base_alert = {
             'timestamp': datetime.now(IST).strftime('%Y-%m-%d %H:%M:%S'),
@@ -134,18 +152,11 @@ def scan_index(symbol, iv_threshold, market_regime, vix, market_open=True):
                 oi_chg = opt.get('changeinOpenInterest') or 0
                 expiry = opt.get('expiryDate', nearest_expiry)
                 
-                # Volume/OI filter - require EITHER good volume OR good OI
-                if market_open:
-                    if not (vol >= vol_thresh or oi >= oi_thresh):
-                        logger.debug("  [SKIP] %s %d CE: vol=%d < %d and oi=%d < %d", 
-                                   symbol, strike, vol, vol_thresh, oi, oi_thresh)
-                        continue
-                else:
-                    # After hours: require very high OI for liquidity
-                    if oi < oi_thresh:
-                        logger.debug("  [SKIP] %s %d CE: oi=%d < %d (after-hours)", 
-                                   symbol, strike, oi, oi_thresh)
-                        continue
+                # Volume/OI filter (EITHER good volume OR good OI; OI only after hours)
+                if strike not in liquid_calls:
+                    logger.debug("  [SKIP] %s %d CE: vol=%d / oi=%d below %d / %d", 
+                               symbol, strike, vol, oi, vol_thresh, oi_thresh)
+                    continue
                 
                 spread_pct = get_option_spread(opt, price, market_open)
                 if spread_pct > spread_limit:
@@ -191,18 +202,11 @@ def scan_index(symbol, iv_threshold, market_regime, vix, market_open=True):
                 oi_chg = opt.get('changeinOpenInterest') or 0
                 expiry = opt.get('expiryDate', nearest_expiry)
                 
-                # Volume/OI filter - require EITHER good volume OR good OI
-                if market_open:
-                    if not (vol >= vol_thresh or oi >= oi_thresh):
-                        logger.debug("  [SKIP] %s %d PE: vol=%d < %d and oi=%d < %d", 
-                                   symbol, strike, vol, vol_thresh, oi, oi_thresh)
-                        continue
-                else:
-                    # After hours: require very high OI for liquidity
-                    if oi < oi_thresh:
-                        logger.debug("  [SKIP] %s %d PE: oi=%d < %d (after-hours)", 
-                                   symbol, strike, oi, oi_thresh)
-                        continue
+                # Volume/OI filter (EITHER good volume OR good OI; OI only after hours)
+                if strike not in liquid_puts:
+                    logger.debug("  [SKIP] %s %d PE: vol=%d / oi=%d below %d / %d", 
+                               symbol, strike, vol, oi, vol_thresh, oi_thresh)
+                    continue
                 
                 spread_pct = get_option_spread(opt, price, market_open)
                 if spread_pct > spread_limit:
@@ -5,6 +5,8 @@ Stock options scanner.
 import time
 from datetime import datetime
 
+import numpy as np
+
 from screener.config import (
     IST, VOLUME_THRESHOLDS, OI_THRESHOLDS,
     AFTER_HOURS_OI_THRESHOLD_STOCK, AFTER_HOURS_SPREAD_PCT,
@@ -17,7 +19,8 @@ from screener.iv.provider import get_iv_data
 from screener.utils.helpers import (
     get_lot_size, get_stock_tier, find_atm_strike, get_moneyness,
     calculate_breakeven, calculate_distance_from_spot, calculate_days_to_expiry,
-    get_option_price, get_option_spread, get_underlying_price, compute_trend_indicators
+    get_option_price, get_option_spread, get_underlying_price, compute_trend_indicators,
+    liquid_strike_mask
 )
 from screener.utils.logging_setup import logger
 from screener.strategies.bull_call_spread import scan_bull_call_spread
@@ -26,7 +29,7 @@ from screener.strategies.long_straddle import scan_long_straddle
 from screener.strategies.long_strangle import scan_long_strangle
 
 
-def scan_stock(symbol, market_regime, vix, market_open=True):
+def scan_stock(symbol, market_regime, vix, market_open=True, option_chain=None, iv_data=None):
     """
     Scan a stock for option trading opportunities.
     
@@ -35,6 +38,9 @@ def scan_stock(symbol, market_regime, vix, market_open=True):
         market_regime: Current market volatility regime
         vix: Current India VIX value
         market_open: Whether market is currently open
+        option_chain: Pre-fetched option chain (see fetch_many_option_chains);
+            fetched here when None
+        iv_data: Pre-fetched IV data (see get_iv_data_batch); fetched here when None
     
     Returns:
         list: List of alert dictionaries
@@ -66,8 +72,9 @@ def scan_stock(symbol, market_regime, vix, market_open=True):
             logger.debug("Stock %s: Spot below minimum (%.2f)", symbol, spot)
             return []
         
-        # Get IV data (Opstra or HV fallback)
-        iv_data = get_iv_data(symbol)
+        # Get IV data (Opstra or HV fallback) unless pre-fetched
+        if iv_data is None:
+            iv_data = get_iv_data(symbol)
         
         trend_data = compute_trend_indicators(symbol)
         
@@ -83,8 +90,8 @@ def scan_stock(symbol, market_regime, vix, market_open=True):
                        symbol, iv_data['iv_percentile'], IV_VERY_HIGH)
             return []
         
-        # Fetch option chain using NSE API v3
-        oc = fetch_nse_option_chain(symbol, is_index=False)
+        # Fetch option chain using NSE API v3 (unless pre-fetched)
+        oc = option_chain if option_chain is not None else fetch_nse_option_chain(symbol, is_index=False)
         
         if not oc or 'records' not in oc:
             logger.debug("Option chain empty for %s", symbol)
@@ -119,7 +126,19 @@ def scan_stock(symbol, market_regime, vix, market_open=True):
         atm = find_atm_strike(strikes, spot)
         step = strikes[1] - strikes[0] if len(strikes) > 1 else 50
         max_distance = step * STRIKE_RANGE_MULTIPLIER
-        strikes_in_range = [s for s in strikes if abs(s - atm) <= max_distance]
+        
+        # Strike-range and Volume/OI filters on the columnar view; only the
+        # surviving strikes go through the per-strike price/spread checks
+        cols = oc['records']['columns']
+        in_range = (cols['strike'] > 0) & (np.abs(cols['strike'] - atm) <= max_distance)
+        call_strikes = sorted({records[i]['strikePrice'] for i in np.flatnonzero(
+            in_range & cols['has_ce']
+            & liquid_strike_mask(cols['ce_volume'], cols['ce_oi'], vol_thresh, oi_thresh, market_open)
+        )})
+        put_strikes = sorted({records[i]['strikePrice'] for i in np.flatnonzero(
+            in_range & cols['has_pe']
+            & liquid_strike_mask(cols['pe_volume'], cols['pe_oi'], vol_thresh, oi_thresh, market_open)
+        )})
         
         base_alert = {
             'timestamp': datetime.now(IST).strftime('%Y-%m-%d %H:%M:%S'),
@@ -145,10 +164,7 @@ def scan_stock(symbol, market_regime, vix, market_open=True):
         
         # Scan CALLS
         if scan_calls:
-            for strike in strikes_in_range:
-                if strike not in calls:
-                    continue
-                
+            for strike in call_strikes:
                 opt = calls[strike]
                 price, price_source = get_option_price(opt, market_open)
                 if price <= 0:
@@ -166,19 +182,6 @@ def scan_stock(symbol, market_regime, vix, market_open=True):
                 oi_chg = opt.get('changeinOpenInterest') or 0
                 expiry = opt.get('expiryDate', nearest_expiry)
                 
-                # Volume/OI filter - require EITHER good volume OR good OI
-                if market_open:
-                    if vol < vol_thresh and oi < oi_thresh:
-                        logger.debug("  [SKIP] %s %d CE: vol=%d < %d AND oi=%d < %d", 
-                                   symbol, strike, vol, vol_thresh, oi, oi_thresh)
-                        continue
-                else:
-                    # After hours: require high OI for liquidity
-                    if oi < oi_thresh:
-                        logger.debug("  [SKIP] %s %d CE: oi=%d < %d (after-hours)", 
-                                   symbol, strike, oi, oi_thresh)
-                        continue
-                
                 spread_pct = get_option_spread(opt, price, market_open)
                 if spread_pct > spread_limit:
                     logger.debug("  [SKIP] %s %d CE: spread=%.2f > %.2f", 
@@ -208,10 +211,7 @@ def scan_stock(symbol, market_regime, vix, market_open=True):
         
         # Scan PUTS
         if scan_puts:
-            for strike in strikes_in_range:
-                if strike not in puts:
-                    continue
-                
+            for strike in put_strikes:
                 opt = puts[strike]
                 price, price_source = get_option_price(opt, market_open)
                 if price <= 0:
@@ -229,19 +229,6 @@ def scan_stock(symbol, market_regime, vix, market_open=True):
                 oi_chg = opt.get('changeinOpenInterest') or 0
                 expiry = opt.get('expiryDate', nearest_expiry)
                 
-                # Volume/OI filter - require EITHER good volume OR good OI
-                if market_open:
-                    if vol < vol_thresh and oi < oi_thresh:
-                        logger.debug("  [SKIP] %s %d PE: vol=%d < %d AND oi=%d < %d", 
-                                   symbol, strike, vol, vol_thresh, oi, oi_thresh)
-                        continue
-                else:
-                    # After hours: require high OI for liquidity
-                    if oi < oi_thresh:
-                        logger.debug("  [SKIP] %s %d PE: oi=%d < %d (after-hours)", 
-                                   symbol, strike, oi, oi_thresh)
-                        continue
-                
                 spread_pct = get_option_spread(opt, price, market_open)
                 if spread_pct > spread_limit:
                     logger.debug("  [SKIP] %s %d PE: spread=%.2f > %.2f", 
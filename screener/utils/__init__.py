@@ -1,21 +1,38 @@
 """Utility functions and helpers."""
 
 from screener.utils.logging_setup import setup_logger, logger
-from screener.utils.helpers import (
-    get_lot_size,
-    get_stock_tier,
-    find_atm_strike,
-    get_moneyness,
-    calculate_breakeven,
-    calculate_distance_from_spot,
-    parse_expiry_date,
-    calculate_days_to_expiry,
-    get_option_price,
-    get_option_spread,
-    get_underlying_price,
-    compute_trend_indicators,
+import importlib
+
+# helpers pulls in yfinance and pandas; load it on first access (PEP 562) so
+# importing screener.utils.logging_setup stays cheap
+_LAZY_HELPERS = (
+    "get_lot_size",
+    "get_stock_tier",
+    "find_atm_strike",
+    "get_moneyness",
+    "calculate_breakeven",
+    "calculate_distance_from_spot",
+    "parse_expiry_date",
+    "calculate_days_to_expiry",
+    "get_option_price",
+    "get_option_spread",
+    "get_underlying_price",
+    "compute_trend_indicators",
 )
 
+
+def __getattr__(name):
+    if name not in _LAZY_HELPERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("screener.utils.helpers"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_HELPERS))
+
+
 __all__ = [
     "setup_logger",
     "logger",
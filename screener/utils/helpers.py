@@ -148,6 +148,28 @@ def calculate_days_to_expiry(expiry_str):
     return -1
 
 
+def liquid_strike_mask(volume, oi, vol_thresh, oi_thresh, market_open=True):
+    """
+    Vectorized Volume/OI filter over option chain columns.
+    
+    During market hours a strike passes with EITHER good volume OR good OI;
+    after hours only OI counts.
+    
+    Args:
+        volume: np.ndarray of traded volume per strike
+        oi: np.ndarray of open interest per strike
+        vol_thresh: Minimum volume
+        oi_thresh: Minimum open interest
+        market_open: Whether market is currently open
+    
+    Returns:
+        np.ndarray: Boolean mask of liquid strikes
+    """
+    if market_open:
+        return (volume >= vol_thresh) | (oi >= oi_thresh)
+    return oi >= oi_thresh
+
+
 def get_option_price(opt, market_open=True):
     """
     Get option price with priority based on market status.
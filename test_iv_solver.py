@@ -0,0 +1,81 @@
+"""
+Test Script for the paper trade tracker's IV solver
+
+Checks calculate_iv_from_premium (Halley steps in a bisection bracket,
+finished with brentq):
+1. Round trip: the IV recovered from a Black-Scholes premium reprices to
+   that premium, over random strikes, expiries and volatilities
+2. Scalar and array input give the same answer
+3. Edge cases: a premium below intrinsic returns the bracket floor (0.01%),
+   and T <= 0 is solved as T = 1e-4
+
+Run from the repository root:
+    python test_iv_solver.py
+"""
+
+import numpy as np
+
+from paper_trade_tracker import (
+    RISK_FREE_RATE, black_scholes_greeks_vec, calculate_iv_from_premium
+)
+
+N_CASES = 3000
+PRICE_TOL = 1e-4  # Rupees
+
+
+def bs_price(S, K, T, sigma, is_call):
+    """Black-Scholes premium (array input)."""
+    return black_scholes_greeks_vec(S, K, T, RISK_FREE_RATE, sigma, is_call)['theoretical_price']
+
+
+def test_round_trip():
+    """Recovered IVs reprice to the input premium."""
+    rng = np.random.default_rng(42)
+    S = rng.uniform(50, 50000, N_CASES)
+    K = S * rng.uniform(0.7, 1.3, N_CASES)
+    T = rng.uniform(1 / 365, 1.0, N_CASES)
+    sigma = rng.uniform(0.05, 1.5, N_CASES)
+    is_call = rng.random(N_CASES) < 0.5
+    premium = bs_price(S, K, T, sigma, is_call)
+
+    iv_pct, greeks = calculate_iv_from_premium(
+        S, K, T, RISK_FREE_RATE, premium, np.where(is_call, 'CE', 'PE')
+    )
+    err = np.abs(bs_price(S, K, T, iv_pct / 100, is_call) - premium)
+    print(f"  {N_CASES} cases: max repricing error = {err.max():.2e}")
+    assert err.max() < PRICE_TOL
+    # The returned Greeks are evaluated at the recovered IV
+    assert np.abs(greeks['theoretical_price'] - premium).max() < PRICE_TOL
+
+    # Scalar input solves to the same IV
+    for i in range(20):
+        iv_i, greeks_i = calculate_iv_from_premium(
+            S[i], K[i], T[i], RISK_FREE_RATE, premium[i], 'CE' if is_call[i] else 'PE'
+        )
+        assert isinstance(iv_i, float)
+        assert abs(iv_i - iv_pct[i]) < 1e-9
+        assert abs(greeks_i.theoretical_price - premium[i]) < PRICE_TOL
+
+
+def test_edge_cases():
+    """Premiums below intrinsic and non-positive expiries."""
+    # Below intrinsic: no volatility reaches the premium, so IV is the floor
+    iv_pct, _ = calculate_iv_from_premium(100, 80, 0.1, RISK_FREE_RATE, 15, 'CE')
+    print(f"  Premium below intrinsic: IV = {iv_pct}%")
+    assert iv_pct == 0.01
+
+    # T <= 0 is clamped to 1e-4 years
+    premium = float(bs_price(100.0, 100.0, 1e-4, 0.5, True))
+    expected, _ = calculate_iv_from_premium(100, 100, 1e-4, RISK_FREE_RATE, premium, 'CE')
+    assert abs(expected - 50.0) < 1e-3
+    for T in (0.0, -1.0):
+        iv_pct, _ = calculate_iv_from_premium(100, 100, T, RISK_FREE_RATE, premium, 'CE')
+        print(f"  T = {T}: IV = {iv_pct:.4f}%")
+        assert iv_pct == expected
+
+
+if __name__ == "__main__":
+    print("--- IV solver round-trip check ---")
+    test_round_trip()
+    test_edge_cases()
+    print("✅ All checks passed")
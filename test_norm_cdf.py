@@ -0,0 +1,40 @@
+"""
+Test Script for the screener's normal CDF
+
+Checks the _norm_cdf used by the CSV and JSON loggers for the
+probability-of-profit columns against scipy.stats.norm.cdf on [-6, 6]:
+1. Mean absolute error below 1e-7
+2. Known values (Phi(0) = 0.5, Phi(1) = 0.8413)
+
+Run from the repository root:
+    python test_norm_cdf.py
+"""
+
+import numpy as np
+from scipy.stats import norm
+
+from screener.output import csv_logger, json_logger
+
+
+def check_norm_cdf(name, norm_cdf):
+    """Compare one _norm_cdf implementation against scipy."""
+    xs = np.linspace(-6, 6, 12001)
+    ours = np.array([norm_cdf(x) for x in xs])
+    err = np.abs(ours - norm.cdf(xs))
+
+    print(f"  {name}: mean |err| = {err.mean():.2e}, max |err| = {err.max():.2e}")
+    assert err.mean() < 1e-7, f"{name}: mean |err| {err.mean():.2e} >= 1e-7"
+    assert abs(norm_cdf(0.0) - 0.5) < 1e-12
+    assert abs(norm_cdf(1.0) - 0.8413447460685429) < 1e-7
+
+
+def test_norm_cdf():
+    """Both loggers' _norm_cdf match scipy.stats.norm.cdf."""
+    check_norm_cdf("csv_logger._norm_cdf", csv_logger._norm_cdf)
+    check_norm_cdf("json_logger._norm_cdf", json_logger._norm_cdf)
+
+
+if __name__ == "__main__":
+    print("--- Normal CDF check ---")
+    test_norm_cdf()
+    print("✅ All checks passed")